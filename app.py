@@ -6,7 +6,9 @@ from plotly.subplots import make_subplots
 import folium
 from streamlit_folium import st_folium
 import os
+import threading
 from scraper import TourismDataScraper
+from scrape_jobs import ScrapeJobManager
 
 # Page config
 st.set_page_config(
@@ -173,12 +175,145 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_scraper():
+    """Scraper bersama untuk semua rerun & session (reuse connection pool HTTP)"""
+    return TourismDataScraper(
+        pool_size=20,
+        cache_dir='.scrape_cache',
+        cache_ttl=3600,
+        profile_path='.scrape_profiles.json',
+        archive_dir='.scrape_archive'
+    )
+
+@st.cache_resource
+def get_job_manager():
+    """Job runner bersama: scraping jalan di background, tetap hidup saat rerun"""
+    return ScrapeJobManager(max_workers=4)
+
+def run_scrape_job(job, scraper, urls, crawl=False, max_pages=20, max_rows=None, table_mode='best',
+                   sitemap=False, sitemap_pattern=None):
+    """Job background: scrape semua URL (atau crawl pagination / sitemap) dan laporkan progress"""
+    job.update(completed=0, total=len(urls), message="Memulai scraping...")
+    # Sitemap / banyak URL: URL yang belum mulai dilewati begitu jumlah baris tercapai
+    stop_event = threading.Event()
+    
+    def on_progress(completed, total, url, df, status):
+        job.progress_callback(completed, total, url, df, status)
+        if job.cancelled or (max_rows and job.partial_rows >= max_rows):
+            stop_event.set()
+    
+    if sitemap:
+        frames, report = [], []
+        for url in urls:
+            if stop_event.is_set() or job.cancelled:
+                break
+            df, pages = scraper.scrape_sitemap(
+                url,
+                pattern=sitemap_pattern or None,
+                progress_callback=on_progress,
+                cancel_event=stop_event,
+                table_mode=table_mode
+            )
+            report.extend(pages)
+            if df is not None:
+                frames.append(df)
+        df = pd.concat(frames, ignore_index=True, sort=False) if frames else None
+        return (df.head(max_rows) if df is not None and max_rows else df), report
+    
+    if not crawl and len(urls) > 1:
+        # Banyak URL: concurrent
+        df, report = scraper.scrape_many(
+            urls,
+            max_workers=8,
+            progress_callback=on_progress,
+            cancel_event=stop_event,
+            table_mode=table_mode
+        )
+        return (df.head(max_rows) if df is not None and max_rows else df), report
+    
+    # Satu URL / crawl: batch bersih (chunk CSV, halaman listing) langsung masuk ke preview
+    report = []
+    job.update(total=max_rows or 0)
+    for url in urls:
+        remaining = max_rows - job.partial_rows if max_rows else None
+        if job.cancelled or remaining == 0:
+            break
+        for batch, status in scraper.iter_scrape(
+            url,
+            max_rows=remaining,
+            table_mode=table_mode,
+            crawl=crawl,
+            max_pages=max_pages,
+            cancel_event=job.cancel_event
+        ):
+            if not report or report[-1] is not status:
+                report.append(status)
+            if batch is not None and 'sumber_url' not in batch.columns:
+                batch = batch.assign(sumber_url=url)
+            job.add_partial(batch)
+            job.update(completed=job.partial_rows,
+                       message=f"{status['url']}: {job.partial_rows:,} baris")
+    
+    df = job.partial_dataframe()
+    return (scraper.drop_duplicate_records(df, report) if df is not None else None), report
+
+@st.fragment(run_every=1)
+def show_scrape_job_progress():
+    """Progress job scraping yang sedang berjalan, di-refresh tiap detik tanpa menjalankan ulang seluruh halaman"""
+    scrape_job = get_job_manager().get(st.session_state.get('scrape_job_id'))
+    if scrape_job is None:
+        return
+    if not scrape_job.is_running:
+        # Job selesai: rerun seluruh halaman supaya hasil ditampilkan
+        st.rerun()
+    
+    st.progress(scrape_job.progress, text=f"⏳ Scraping {scrape_job.completed}/{scrape_job.total}... {scrape_job.message}")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.info(f"📊 {scrape_job.partial_rows:,} baris terkumpul sejauh ini")
+    with col2:
+        if st.button("⏹️ Batalkan", key="cancel_scrape_job", use_container_width=True):
+            scrape_job.cancel()
+    
+    partial_df = scrape_job.partial_dataframe()
+    if partial_df is not None:
+        st.markdown("### 👀 Hasil Sementara")
+        # Baris terbaru di bawah, preview ikut bertambah setiap batch masuk
+        st.dataframe(partial_df.tail(20), use_container_width=True, height=300)
+
+def run_reprocess_job(job, scraper, urls=None, table_mode='best'):
+    """Job background: proses ulang halaman dari arsip (extraction + cleaning) tanpa request ke network"""
+    job.update(completed=0, total=len(scraper.archive.entries(urls)), message="Memproses ulang arsip...")
+    return scraper.reprocess_archive(
+        urls,
+        progress_callback=job.progress_callback,
+        cancel_event=job.cancel_event,
+        table_mode=table_mode
+    )
+
 # Initialize session state
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
 if 'df' not in st.session_state:
     st.session_state.df = None
 
+def normalize_kategori(series):
+    """Trim + Title Case label kategori; kolom category diproses per label saja sehingga tetap category"""
+    if isinstance(series.dtype, pd.CategoricalDtype) and not series.isna().any():
+        labels = series.cat.categories.astype(str).str.strip().str.title()
+        if labels.is_unique:
+            return series.cat.rename_categories(labels)
+    return series.astype(str).str.strip().str.title()
+
+def show_memory_report(df):
+    """Caption memory DataFrame sebelum/sesudah optimize_dtypes (jika ada)"""
+    memory = df.attrs.get('memory_bytes') if df is not None else None
+    if memory:
+        st.caption(f"💾 Memori data: {memory['before'] / 1024 / 1024:.2f} MB → {memory['after'] / 1024 / 1024:.2f} MB "
+                   f"(dtype category / string / float32)")
+
 def load_data_from_file(filepath):
     """Load data from CSV/Excel"""
     try:
@@ -434,15 +569,24 @@ elif page == "Web Scraping":
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            url = st.text_input(
-                "🔗 Masukkan URL (Tabel HTML, CSV, atau JSON)",
+            url_input = st.text_area(
+                "🔗 Masukkan URL (Tabel HTML, CSV, atau JSON) - satu URL per baris",
                 "",
-                placeholder="https://example.com/data",
-                key="scrape_url"
+                placeholder="https://example.com/data\nhttps://example.com/data-2",
+                key="scrape_url",
+                height=100
             )
+            urls = [u.strip() for u in url_input.splitlines() if u.strip()]
         
         with col2:
             scrape_btn = st.button("🚀 Scrape", type="primary", use_container_width=True)
+            reprocess_btn = st.button(
+                "♻️ Proses Ulang Arsip",
+                use_container_width=True,
+                key="reprocess_archive_btn",
+                help=f"Extract + cleaning ulang {len(get_scraper().archive):,} halaman tersimpan tanpa request ulang "
+                     "(URL di kiri = hanya URL tersebut, kosong = semua)"
+            )
         
         # Row selection for scraping
         st.markdown("---")
@@ -467,6 +611,54 @@ elif page == "Web Scraping":
         with col3:
             st.metric("Pilihan Anda", f"{scrape_max_rows:,}", delta="rows")
         
+        col1, col2, col3 = st.columns([2, 1, 2])
+        
+        with col1:
+            crawl_mode = st.checkbox(
+                "🔁 Ikuti pagination (?page=N / tombol Next)",
+                value=False,
+                key="scrape_crawl",
+                help="Crawl otomatis halaman-halaman berikutnya dari listing multi-halaman"
+            )
+        
+        with col2:
+            crawl_max_pages = st.number_input(
+                "Maks halaman per URL",
+                min_value=1,
+                max_value=200,
+                value=20,
+                step=1,
+                key="scrape_crawl_pages",
+                disabled=not crawl_mode
+            )
+        
+        with col3:
+            union_tables = st.checkbox(
+                "🧩 Gabungkan semua tabel yang kompatibel",
+                value=False,
+                key="scrape_union_tables",
+                help="Untuk halaman yang memecah data ke beberapa tabel (misal satu tabel per provinsi)"
+            )
+        
+        col1, col2 = st.columns([2, 3])
+        
+        with col1:
+            sitemap_mode = st.checkbox(
+                "🗺️ URL adalah sitemap.xml",
+                value=False,
+                key="scrape_sitemap",
+                help="Ambil semua URL halaman dari sitemap / sitemap index (termasuk .xml.gz) lalu scrape"
+            )
+        
+        with col2:
+            sitemap_pattern = st.text_input(
+                "Filter URL sitemap (regex)",
+                value="",
+                key="scrape_sitemap_pattern",
+                placeholder="contoh: /wisata/|/destinasi/",
+                disabled=not sitemap_mode
+            )
+        
         st.markdown("---")
         
         with st.expander("💡 TIPS SCRAPING DATA"):
@@ -506,224 +698,265 @@ elif page == "Web Scraping":
             """)
         
         if scrape_btn:
-            if url and url.startswith(('http://', 'https://')):
-                with st.spinner("⏳ Sedang scraping data..."):
-                    try:
-                        scraper = TourismDataScraper()
-                        df = scraper.scrape_from_url(url)
+            if urls and all(u.startswith(('http://', 'https://')) for u in urls):
+                st.session_state.scrape_job_id = get_job_manager().submit(
+                    run_scrape_job, get_scraper(), urls,
+                    crawl=crawl_mode,
+                    max_pages=int(crawl_max_pages),
+                    max_rows=scrape_max_rows,
+                    table_mode='union' if union_tables else 'best',
+                    sitemap=sitemap_mode,
+                    sitemap_pattern=sitemap_pattern.strip(),
+                    description=f"Scrape {len(urls)} URL"
+                )
+            else:
+                st.error("❌ Masukkan URL yang valid (setiap baris mulai dengan http:// atau https://)")
+        
+        if reprocess_btn:
+            if len(get_scraper().archive.entries(urls or None)) == 0:
+                st.warning("⚠️ Belum ada halaman di arsip untuk URL tersebut. Scrape dulu minimal sekali.")
+            else:
+                st.session_state.scrape_job_id = get_job_manager().submit(
+                    run_reprocess_job, get_scraper(), urls or None,
+                    table_mode='union' if union_tables else 'best',
+                    description="Proses ulang arsip halaman"
+                )
+        
+        scrape_job = get_job_manager().get(st.session_state.get('scrape_job_id'))
+        
+        if scrape_job is not None and scrape_job.is_running:
+            # Job masih berjalan di background: progress di-polling oleh fragment, halaman lain tetap ter-render
+            show_scrape_job_progress()
+        
+        elif scrape_job is not None:
+            # Job selesai: tampilkan hasil sekali, lalu lepas dari session
+            st.session_state.scrape_job_id = None
+            
+            if scrape_job.status == 'failed':
+                st.error(f"❌ Gagal scraping: {scrape_job.error}")
+                st.info("💡 Solusi:\n- Periksa kembali URL\n- Pastikan situs dapat diakses\n- Coba URL lain dari rekomendasi")
+            else:
+                if scrape_job.status == 'cancelled':
+                    st.warning("⏹️ Scraping dibatalkan - menampilkan hasil dari URL yang sudah selesai")
+                
+                scraper = get_scraper()
+                df, scrape_report = scrape_job.result
+                if len(scrape_report) > 1:
+                    st.markdown("### 🌐 Status per URL / Halaman")
+                    st.dataframe(pd.DataFrame(scrape_report), use_container_width=True)
+                
+                try:
+                    # Check if scraping returned valid data
+                    if df is None or len(df) == 0:
+                        st.error("❌ Tidak berhasil extract data dari URL - DataFrame kosong atau None")
+                        st.info("💡 Solusi:\n- Gunakan salah satu URL dari REKOMENDASI yang disediakan\n- Pastikan URL bukan halaman dinamis/JavaScript")
+                    else:
+                        # Apply row limit
+                        if len(df) > scrape_max_rows:
+                            st.warning(f"⚠️ Data di-trim dari {len(df)} menjadi {scrape_max_rows} baris")
+                            df = df.head(scrape_max_rows)
                         
-                        # Check if scraping returned valid data
-                        if df is None or len(df) == 0:
-                            st.error("❌ Tidak berhasil extract data dari URL - DataFrame kosong atau None")
-                            st.info("💡 Solusi:\n- Gunakan salah satu URL dari REKOMENDASI yang disediakan\n- Pastikan URL bukan halaman dinamis/JavaScript")
-                        else:
-                            # Apply row limit
-                            if len(df) > scrape_max_rows:
-                                st.warning(f"⚠️ Data di-trim dari {len(df)} menjadi {scrape_max_rows} baris")
-                                df = df.head(scrape_max_rows)
-                            
-                            st.session_state.df = df
-                            st.session_state.data_loaded = True
-                            
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.success(f"✅ Berhasil scrape {len(df)} records!")
-                            with col2:
-                                st.info(f"📊 {len(df.columns)} kolom ditemukan")
-                            with col3:
-                                st.info(f"✨ Data siap untuk dianalisis")
-                            
-                            st.balloons()
-                            
-                            # Data preview - Before Mapping
-                            st.markdown("### 📋 Data Hasil Scraping (Before Mapping)")
-                            st.write(f"**Kolom:** {list(df.columns)}")
-                            st.dataframe(df.head(10), use_container_width=True, height=300)
-                            
-                            # Column Mapping
-                            st.markdown("---")
-                            st.markdown("### 🔧 Column Mapping Otomatis")
-                            
+                        # Dtype hemat memori untuk frame session (juga merapikan kategori setelah trim/gabung)
+                        df = scraper.optimize_dtypes(df)
+                        st.session_state.df = df
+                        st.session_state.data_loaded = True
+                        
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.success(f"✅ Berhasil scrape {len(df)} records!")
+                        with col2:
+                            st.info(f"📊 {len(df.columns)} kolom ditemukan")
+                        with col3:
+                            st.info(f"✨ Data siap untuk dianalisis")
+                        
+                        st.balloons()
+                        
+                        # Data preview - Before Mapping
+                        st.markdown("### 📋 Data Hasil Scraping (Before Mapping)")
+                        st.write(f"**Kolom:** {list(df.columns)}")
+                        st.dataframe(df.head(10), use_container_width=True, height=300)
+                        
+                        # Column Mapping
+                        st.markdown("---")
+                        st.markdown("### 🔧 Column Mapping Otomatis")
+                        
+                        st.info("""
+                        **Apa itu Column Mapping?**
+                        Sistem otomatis mendeteksi dan menstandarkan nama kolom hasil scraping agar kompatibel dengan visualisasi.
+                        """)
+                        
+                        df_mapped = scraper.map_columns(df)
+                        df_mapped = scraper.extract_coordinates(df_mapped)
+                        
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.write("**SEBELUM Mapping:**")
+                            st.write(f"Kolom: {list(df.columns)}")
+                            st.dataframe(df.head(5), use_container_width=True, height=200)
+                        
+                        with col2:
+                            st.write("**SESUDAH Mapping + AUTO GEOCODING:**")
+                            st.write(f"Kolom: {list(df_mapped.columns)}")
+                            st.info("✅ Koordinat (latitude/longitude) otomatis di-generate dari nama lokasi/provinsi!")
+                            st.dataframe(df_mapped.head(5), use_container_width=True, height=200)
+                        
+                        show_memory_report(df_mapped)
+                        st.session_state.df = df_mapped
+                        
+                        # Data Quality Check
+                        st.markdown("---")
+                        st.markdown("### ✅ Data Quality & Accuracy Report")
+                        
+                        # Get detailed accuracy report
+                        accuracy_report = scraper.get_data_accuracy_report(df_mapped)
+                        
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            quality_score = accuracy_report.get('data_quality_score', 0)
+                            if quality_score >= 80:
+                                st.success(f"✅ Kualitas Data: {quality_score:.1f}%")
+                            elif quality_score >= 60:
+                                st.warning(f"⚠️ Kualitas Data: {quality_score:.1f}%")
+                            else:
+                                st.error(f"❌ Kualitas Data: {quality_score:.1f}%")
+                        
+                        with col2:
+                            st.info(f"📊 Dataset Overview:\n- Total Baris: {len(df_mapped):,}\n- Total Kolom: {len(df_mapped.columns)}")
+                        
+                        with col3:
+                            st.info(f"💾 Ukuran: {df_mapped.memory_usage(deep=True).sum() / 1024:.2f} KB")
+                        
+                        # Completeness by column
+                        st.markdown("### 📋 Data Completeness per Kolom")
+                        
+                        completeness_data = []
+                        for col, details in accuracy_report['completeness_by_column'].items():
+                            completeness_data.append({
+                                'Kolom': col,
+                                'Completeness': f"{details['completeness_percent']:.1f}%",
+                                'Filled': details['filled'],
+                                'Missing': details['missing'],
+                            })
+                        
+                        completeness_df = pd.DataFrame(completeness_data)
+                        
+                        col1, col2 = st.columns([2, 1])
+                        
+                        with col1:
+                            fig = px.bar(
+                                completeness_df,
+                                x='Completeness',
+                                y='Kolom',
+                                orientation='h',
+                                title='📊 Data Completeness per Kolom (%)',
+                                color='Completeness',
+                                color_continuous_scale=['#ff4444', '#ffaa00', '#00cc00'],
+                                text='Completeness'
+                            )
+                            fig.update_traces(textposition='outside')
+                            fig.update_layout(height=300)
+                            st.plotly_chart(fig, use_container_width=True)
+                        
+                        with col2:
+                            st.markdown("**Penjelasan Completeness:**")
                             st.info("""
-                            **Apa itu Column Mapping?**
-                            Sistem otomatis mendeteksi dan menstandarkan nama kolom hasil scraping agar kompatibel dengan visualisasi.
+                            - **100%**: Semua baris terisi
+                            - **80-99%**: Sebagian kecil kosong
+                            - **50-79%**: Cukup data kosong
+                            - **<50%**: Data banyak kosong
                             """)
-                            
-                            scraper = TourismDataScraper()
-                            df_mapped = scraper.map_columns(df)
-                            df_mapped = scraper.extract_coordinates(df_mapped)
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.write("**SEBELUM Mapping:**")
-                                st.write(f"Kolom: {list(df.columns)}")
-                                st.dataframe(df.head(5), use_container_width=True, height=200)
-                            
-                            with col2:
-                                st.write("**SESUDAH Mapping + AUTO GEOCODING:**")
-                                st.write(f"Kolom: {list(df_mapped.columns)}")
-                                st.info("✅ Koordinat (latitude/longitude) otomatis di-generate dari nama lokasi/provinsi!")
-                                st.dataframe(df_mapped.head(5), use_container_width=True, height=200)
-                            
-                            st.session_state.df = df_mapped
-                            
-                            # Data Quality Check
-                            st.markdown("---")
-                            st.markdown("### ✅ Data Quality & Accuracy Report")
-                            
-                            # Get detailed accuracy report
-                            scraper = TourismDataScraper()
-                            accuracy_report = scraper.get_data_accuracy_report(df_mapped)
-                            
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                quality_score = accuracy_report.get('data_quality_score', 0)
-                                if quality_score >= 80:
-                                    st.success(f"✅ Kualitas Data: {quality_score:.1f}%")
-                                elif quality_score >= 60:
-                                    st.warning(f"⚠️ Kualitas Data: {quality_score:.1f}%")
+                        
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.markdown("**WAJIB ADA:**")
+                            required_cols = ['nama', 'provinsi', 'latitude', 'longitude']
+                            for col in required_cols:
+                                if col in df_mapped.columns:
+                                    st.write(f"✅ `{col}`")
                                 else:
-                                    st.error(f"❌ Kualitas Data: {quality_score:.1f}%")
-                            
-                            with col2:
-                                st.info(f"📊 Dataset Overview:\n- Total Baris: {len(df_mapped):,}\n- Total Kolom: {len(df_mapped.columns)}")
-                            
-                            with col3:
-                                st.info(f"💾 Ukuran: {df_mapped.memory_usage(deep=True).sum() / 1024:.2f} KB")
-                            
-                            # Completeness by column
-                            st.markdown("### 📋 Data Completeness per Kolom")
-                            
-                            completeness_data = []
-                            for col, details in accuracy_report['completeness_by_column'].items():
-                                completeness_data.append({
-                                    'Kolom': col,
-                                    'Completeness': f"{details['completeness_percent']:.1f}%",
-                                    'Filled': details['filled'],
-                                    'Missing': details['missing'],
-                                })
-                            
-                            completeness_df = pd.DataFrame(completeness_data)
-                            
-                            col1, col2 = st.columns([2, 1])
-                            
-                            with col1:
-                                fig = px.bar(
-                                    completeness_df,
-                                    x='Completeness',
-                                    y='Kolom',
-                                    orientation='h',
-                                    title='📊 Data Completeness per Kolom (%)',
-                                    color='Completeness',
-                                    color_continuous_scale=['#ff4444', '#ffaa00', '#00cc00'],
-                                    text='Completeness'
-                                )
-                                fig.update_traces(textposition='outside')
-                                fig.update_layout(height=300)
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            with col2:
-                                st.markdown("**Penjelasan Completeness:**")
-                                st.info("""
-                                - **100%**: Semua baris terisi
-                                - **80-99%**: Sebagian kecil kosong
-                                - **50-79%**: Cukup data kosong
-                                - **<50%**: Data banyak kosong
-                                """)
-                            
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                st.markdown("**WAJIB ADA:**")
-                                required_cols = ['nama', 'provinsi', 'latitude', 'longitude']
-                                for col in required_cols:
-                                    if col in df_mapped.columns:
-                                        st.write(f"✅ `{col}`")
-                                    else:
-                                        st.write(f"❌ `{col}`")
-                            
-                            with col2:
-                                st.markdown("**DISARANKAN:**")
-                                recommended_cols = ['kategori', 'rating', 'kota']
-                                for col in recommended_cols:
-                                    if col in df_mapped.columns:
-                                        non_null = df_mapped[col].notna().sum()
-                                        pct = (non_null / len(df_mapped) * 100)
-                                        st.write(f"✅ `{col}` ({pct:.0f}%)")
-                                    else:
-                                        st.write(f"⚠️ `{col}`")
-                            
-                            with col3:
-                                st.markdown("**OPSIONAL:**")
-                                optional_cols = ['deskripsi', 'harga']
-                                for col in optional_cols:
-                                    if col in df_mapped.columns:
-                                        non_null = df_mapped[col].notna().sum()
-                                        pct = (non_null / len(df_mapped) * 100)
-                                        st.write(f"✅ `{col}` ({pct:.0f}%)")
-                                    else:
-                                        st.write(f"⚠️ `{col}`")
-                            
-                            # Statistics
-                            st.markdown("---")
-                            st.markdown("### 📊 Informasi Dataset")
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("Jumlah Baris", len(df_mapped))
-                            with col2:
-                                st.metric("Jumlah Kolom", len(df_mapped.columns))
-                            with col3:
-                                st.metric("Memory", f"{df_mapped.memory_usage(deep=True).sum() / 1024:.2f} KB")
-                            
-                            # Download option
-                            st.markdown("---")
-                            st.markdown("### 💾 Download Data")
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                csv = df_mapped.to_csv(index=False, encoding='utf-8-sig')
+                                    st.write(f"❌ `{col}`")
+                        
+                        with col2:
+                            st.markdown("**DISARANKAN:**")
+                            recommended_cols = ['kategori', 'rating', 'kota']
+                            for col in recommended_cols:
+                                if col in df_mapped.columns:
+                                    non_null = df_mapped[col].notna().sum()
+                                    pct = (non_null / len(df_mapped) * 100)
+                                    st.write(f"✅ `{col}` ({pct:.0f}%)")
+                                else:
+                                    st.write(f"⚠️ `{col}`")
+                        
+                        with col3:
+                            st.markdown("**OPSIONAL:**")
+                            optional_cols = ['deskripsi', 'harga']
+                            for col in optional_cols:
+                                if col in df_mapped.columns:
+                                    non_null = df_mapped[col].notna().sum()
+                                    pct = (non_null / len(df_mapped) * 100)
+                                    st.write(f"✅ `{col}` ({pct:.0f}%)")
+                                else:
+                                    st.write(f"⚠️ `{col}`")
+                        
+                        # Statistics
+                        st.markdown("---")
+                        st.markdown("### 📊 Informasi Dataset")
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Jumlah Baris", len(df_mapped))
+                        with col2:
+                            st.metric("Jumlah Kolom", len(df_mapped.columns))
+                        with col3:
+                            st.metric("Memory", f"{df_mapped.memory_usage(deep=True).sum() / 1024:.2f} KB")
+                        
+                        # Download option
+                        st.markdown("---")
+                        st.markdown("### 💾 Download Data")
+                        
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            csv = df_mapped.to_csv(index=False, encoding='utf-8-sig')
+                            st.download_button(
+                                "📥 Download CSV",
+                                csv,
+                                "data_scraping.csv",
+                                "text/csv",
+                                use_container_width=True
+                            )
+                        
+                        with col2:
+                            try:
+                                from openpyxl import Workbook
+                                from openpyxl.utils.dataframe import dataframe_to_rows
+                                from io import BytesIO
+                                
+                                def to_excel_bytes(df):
+                                    wb = Workbook()
+                                    ws = wb.active
+                                    for r in dataframe_to_rows(df, index=False, header=True):
+                                        ws.append(r)
+                                    stream = BytesIO()
+                                    wb.save(stream)
+                                    return stream.getvalue()
+                                
+                                excel_bytes = to_excel_bytes(df)
                                 st.download_button(
-                                    "📥 Download CSV",
-                                    csv,
-                                    "data_scraping.csv",
-                                    "text/csv",
+                                    "📥 Download Excel",
+                                    excel_bytes,
+                                    "data_scraping.xlsx",
+                                    "application/vnd.ms-excel",
                                     use_container_width=True
                                 )
-                            
-                            with col2:
-                                try:
-                                    from openpyxl import Workbook
-                                    from openpyxl.utils.dataframe import dataframe_to_rows
-                                    from io import BytesIO
-                                    
-                                    def to_excel_bytes(df):
-                                        wb = Workbook()
-                                        ws = wb.active
-                                        for r in dataframe_to_rows(df, index=False, header=True):
-                                            ws.append(r)
-                                        stream = BytesIO()
-                                        wb.save(stream)
-                                        return stream.getvalue()
-                                    
-                                    excel_bytes = to_excel_bytes(df)
-                                    st.download_button(
-                                        "📥 Download Excel",
-                                        excel_bytes,
-                                        "data_scraping.xlsx",
-                                        "application/vnd.ms-excel",
-                                        use_container_width=True
-                                    )
-                                except:
-                                    pass
-                    
-                    except Exception as e:
-                        st.error(f"❌ Gagal scraping: {str(e)}")
-                        st.info("💡 Solusi:\n- Periksa kembali URL\n- Pastikan situs dapat diakses\n- Coba URL lain dari rekomendasi")
-            else:
-                st.error("❌ Masukkan URL yang valid (mulai dengan http:// atau https://)")
+                            except:
+                                pass
+                
+                except Exception as e:
+                    st.error(f"❌ Gagal scraping: {str(e)}")
+                    st.info("💡 Solusi:\n- Periksa kembali URL\n- Pastikan situs dapat diakses\n- Coba URL lain dari rekomendasi")
     
     with tab2:
         st.markdown("## 📤 Upload File")
@@ -797,7 +1030,7 @@ elif page == "Web Scraping":
                     - "stars" → diubah menjadi "rating"
                     """)
                     
-                    scraper = TourismDataScraper()
+                    scraper = get_scraper()
                     df_mapped = scraper.map_columns(df)
                     
                     col1, col2 = st.columns(2)
@@ -813,7 +1046,9 @@ elif page == "Web Scraping":
                         st.info("✅ Koordinat (latitude/longitude) otomatis di-generate dari nama lokasi/provinsi untuk Indonesia maupun worldwide data!")
                         st.dataframe(df_mapped.head(5), use_container_width=True, height=200)
                     
-                    # Update session state
+                    # Update session state (dtype hemat memori)
+                    df_mapped = scraper.optimize_dtypes(df_mapped)
+                    show_memory_report(df_mapped)
                     st.session_state.df = df_mapped
                     
                     # Data Quality Check
@@ -821,7 +1056,6 @@ elif page == "Web Scraping":
                     st.markdown("### ✅ Data Quality & Accuracy Report")
                     
                     # Get detailed accuracy report
-                    scraper = TourismDataScraper()
                     accuracy_report = scraper.get_data_accuracy_report(df_mapped)
                     
                     col1, col2, col3 = st.columns(3)
@@ -1256,7 +1490,7 @@ elif page == "Visualisasi Data":
             )
             
             if analysis_type == "Distribution":
-                object_cols = df.select_dtypes(include=['object']).columns.tolist()
+                object_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
                 if object_cols:
                     col = st.selectbox("Pilih Kolom", object_cols, key="dist_col")
                     if col and not df[col].isna().all():
@@ -1307,7 +1541,7 @@ elif page == "Visualisasi Data":
                     st.warning("Minimal 2 kolom numerik diperlukan")
             
             elif analysis_type == "Percentage":
-                object_cols = df.select_dtypes(include=['object']).columns.tolist()
+                object_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
                 if object_cols:
                     col = st.selectbox("Pilih Kolom", object_cols, key="pct_col")
                     if col and not df[col].isna().all():
@@ -1360,7 +1594,7 @@ elif page == "Visualisasi Data":
             
             elif analysis_type == "Box Plot":
                 numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-                object_cols = df.select_dtypes(include=['object']).columns.tolist()
+                object_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
                 
                 if numeric_cols:
                     col1, col2 = st.columns(2)
@@ -1463,7 +1697,7 @@ elif page == "GIS Mapping":
         df = st.session_state.df
         
         # Validate coordinates
-        scraper = TourismDataScraper()
+        scraper = get_scraper()
         
         if 'latitude' not in df.columns or 'longitude' not in df.columns:
             st.info("🔄 Generating coordinates from location data...")
@@ -1534,7 +1768,7 @@ elif page == "GIS Mapping":
             
             # Normalize kategori upfront for consistency
             if 'kategori' in df.columns:
-                df['kategori'] = df['kategori'].astype(str).str.strip().str.title()
+                df['kategori'] = normalize_kategori(df['kategori'])
             
             if 'provinsi' in df.columns and not df['provinsi'].isna().all():
                 with col1:
@@ -0,0 +1,324 @@
+"""
+Benchmark pipeline cleaning: implementasi lama (disalin di bawah apa adanya) vs TourismDataScraper sekarang
+Output kedua implementasi dibandingkan dulu, baru diukur waktunya
+
+Jalankan:
+    python benchmark.py --rows 500000
+    python benchmark.py --rows 100000 --memory   (ikut ukur peak memory, lebih lambat)
+"""
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from scraper import TourismDataScraper
+
+
+# ---------------------------------------------------------------------------
+# Implementasi lama (referensi, jangan diubah)
+# ---------------------------------------------------------------------------
+
+def legacy_normalize(df):
+    """Tahap awal clean_scraped_data versi lama: baris/kolom kosong, nama kolom, trim string"""
+    # Remove completely empty columns
+    df = df.dropna(axis=1, how='all')
+    df = df.loc[:, df.astype(str).ne('').any()]
+
+    # Remove completely empty rows
+    df = df.dropna(axis=0, how='all')
+    df = df[df.astype(str).ne('').any(axis=1)]
+
+    # Clean column names
+    df.columns = df.columns.str.strip()
+    df.columns = df.columns.str.replace(r'[\n\r\t]', ' ', regex=True)
+
+    # Handle duplicate column names
+    if df.columns.duplicated().any():
+        cols = pd.Series(df.columns)
+        for dup in cols[cols.duplicated()].unique():
+            dups = cols[cols == dup].index.tolist()
+            for i, idx in enumerate(dups):
+                df.columns.values[idx] = f"{dup}_{i}"
+
+    # Clean string columns
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            df[col] = df[col].astype(str).str.strip()
+            df[col] = df[col].replace(['nan', 'None', '', 'N/A', 'n/a'], np.nan)
+
+    return df.reset_index(drop=True)
+
+
+def legacy_validate_numeric(df):
+    """Validasi rating/harga versi lama"""
+    if 'rating' in df.columns:
+        df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
+        df.loc[(df['rating'] > 5) | (df['rating'] < 0), 'rating'] = np.nan
+    if 'harga' in df.columns:
+        df['harga'] = pd.to_numeric(df['harga'], errors='coerce')
+        df.loc[df['harga'] < 0, 'harga'] = np.nan
+    return df
+
+
+def legacy_synthetic_columns(df):
+    """create_synthetic_columns versi lama (kategori dari keyword nama lewat iterrows)"""
+    print("[SYNTHETIC] Creating synthetic columns if missing...")
+
+    # Jika tidak ada kategori, coba extract dari nama atau buat default
+    if 'kategori' not in df.columns:
+        kategori_keywords = {
+            'beach': ['beach', 'pantai', 'laut', 'sea', 'coast', 'shore'],
+            'mountain': ['mountain', 'gunung', 'peak', 'alpine', 'hiking'],
+            'temple': ['temple', 'candi', 'shrine', 'pagoda', 'religious'],
+            'museum': ['museum', 'gallery', 'art', 'historical'],
+            'city': ['city', 'kota', 'town', 'urban', 'metropolitan'],
+            'nature': ['park', 'forest', 'nature', 'hutan', 'taman', 'alam'],
+            'water': ['lake', 'danau', 'waterfall', 'air terjun', 'geyser'],
+        }
+
+        categories = []
+        nama_col = 'nama' if 'nama' in df.columns else None
+
+        for idx, row in df.iterrows():
+            cat = 'Attraction'
+            if nama_col:
+                text = str(row[nama_col]).lower()
+                for category, keywords in kategori_keywords.items():
+                    if any(kw in text for kw in keywords):
+                        cat = category.title()
+                        break
+            categories.append(cat)
+
+        df['kategori'] = categories
+        print(f"[SYNTHETIC] Created 'kategori' column with {len(set(categories))} categories")
+
+    # Jika tidak ada rating, buat default
+    if 'rating' not in df.columns:
+        df['rating'] = np.nan
+        print("[SYNTHETIC] Created 'rating' column (empty)")
+
+    # Jika tidak ada kota, buat default dari provinsi
+    if 'kota' not in df.columns and 'provinsi' in df.columns:
+        df['kota'] = df['provinsi'].apply(lambda x: str(x).split(',')[0].strip() if pd.notna(x) else 'Unknown')
+        print("[SYNTHETIC] Created 'kota' column from 'provinsi'")
+
+    return df
+
+
+def legacy_extract_coordinates(df):
+    """extract_coordinates versi lama (loop per baris; tabel koordinat sama dengan TourismDataScraper)"""
+    if df is None or len(df) == 0:
+        return None
+
+    print("[COORDS] Extracting/generating coordinates...")
+
+    province_coords = TourismDataScraper.PROVINCE_COORDS
+    tourism_coords = TourismDataScraper.TOURISM_COORDS
+
+    if 'latitude' not in df.columns or 'longitude' not in df.columns:
+        df['latitude'] = np.nan
+        df['longitude'] = np.nan
+
+    # Try to get location columns
+    location_cols = [col for col in df.columns
+                    if col.lower() in ['provinsi', 'kota', 'lokasi', 'nama', 'destinasi', 'province', 'city', 'location']]
+
+    if not location_cols:
+        print("[WARN] No location columns found")
+        return df
+
+    coords_added = 0
+
+    for idx in df.index:
+        # Skip jika sudah ada valid coordinates
+        try:
+            lat = pd.to_numeric(df.at[idx, 'latitude'], errors='coerce')
+            lon = pd.to_numeric(df.at[idx, 'longitude'], errors='coerce')
+
+            if pd.notna(lat) and pd.notna(lon) and -90 <= lat <= 90 and -180 <= lon <= 180:
+                continue
+        except:
+            pass
+
+        # Try to match dengan tourism coordinates
+        found = False
+        for loc_col in location_cols:
+            if found:
+                break
+
+            try:
+                location_text = str(df.at[idx, loc_col]).strip()
+                if not location_text or location_text.lower() == 'nan':
+                    continue
+
+                location_lower = location_text.lower()
+
+                # First try tourism coordinates (more specific)
+                for place, coords in tourism_coords.items():
+                    if place.lower() in location_lower:
+                        df.at[idx, 'latitude'] = coords[0]
+                        df.at[idx, 'longitude'] = coords[1]
+                        found = True
+                        coords_added += 1
+                        break
+
+                # Then try province coordinates (more general)
+                # Sort by length descending to match longer names first (e.g., 'Maluku Utara' before 'Maluku')
+                if not found:
+                    sorted_provinces = sorted(province_coords.items(), key=lambda x: len(x[0]), reverse=True)
+                    for prov, coords in sorted_provinces:
+                        if prov.lower() in location_lower:
+                            df.at[idx, 'latitude'] = coords[0]
+                            df.at[idx, 'longitude'] = coords[1]
+                            found = True
+                            coords_added += 1
+                            break
+            except Exception as e:
+                print(f"[WARN] Error processing row {idx}: {e}")
+                continue
+
+    print(f"[OK] Coordinates added: {coords_added} rows")
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Data uji
+# ---------------------------------------------------------------------------
+
+def make_frame(rows, seed=42):
+    """
+    Data mirip hasil scraping: kolom teks object dengan spasi, sentinel (N/A, None, ''),
+    angka dalam bentuk string, satu kolom kosong, satu kolom NaN, dan ~1% baris kosong
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array(['Pantai Kuta', 'Candi Borobudur', 'Gunung Bromo', 'Danau Toba', 'Museum Nasional',
+                      'Taman Mini', 'Air Terjun Sipiso-piso', 'Kota Tua', 'Pura Besakih', 'Hutan Pinus'])
+    provinces = np.array(TourismDataScraper.PROVINCES)
+    sentinels = np.array(['', 'N/A', 'n/a', 'None', '  '], dtype=object)
+
+    def noisy(values, blank_ratio=0.05):
+        values = values.astype(object)
+        pad = rng.random(rows) < 0.3
+        values[pad] = [f"  {v} " for v in values[pad]]
+        blank = rng.random(rows) < blank_ratio
+        values[blank] = sentinels[rng.integers(0, len(sentinels), blank.sum())]
+        values[rng.random(rows) < 0.02] = np.nan
+        # dtype object eksplisit: pandas 3 akan menebak dtype str, implementasi lama hanya membersihkan object
+        return pd.Series(values, dtype=object)
+
+    df = pd.DataFrame({
+        'Nama Tempat': noisy(np.char.add(names[rng.integers(0, len(names), rows)],
+                                         rng.integers(0, 1000, rows).astype(str))),
+        'Provinsi ': noisy(provinces[rng.integers(0, len(provinces), rows)]),
+        'Rating': noisy(np.round(rng.uniform(-1, 6, rows), 1).astype(str)),
+        'Harga Tiket': noisy(rng.integers(-5000, 150000, rows).astype(str)),
+        'Deskripsi\n': noisy(np.repeat('Destinasi wisata populer di Indonesia', rows)),
+        'Catatan': pd.Series([''] * rows, dtype=object),
+        'Kosong': pd.Series([np.nan] * rows, dtype=object),
+        'Pengunjung': rng.integers(0, 100000, rows),
+    })
+    blank_rows = rng.random(rows) < 0.01
+    df.loc[blank_rows, df.columns != 'Pengunjung'] = np.nan
+    df.loc[blank_rows, 'Pengunjung'] = np.nan
+    return df
+
+
+def with_locations(df, seed=7):
+    """
+    Tambah kolom kota + latitude/longitude campuran (valid, kosong, di luar range) untuk tahap geocoding
+    Kota berisi nama tempat wisata, nama provinsi di dalam teks, dan teks tanpa kecocokan
+    """
+    rng = np.random.default_rng(seed)
+    rows = len(df)
+    cities = np.array(['Kota Bandung', 'Jakarta Selatan', 'Bali dan Aceh', 'Maluku Utara', 'kab. sleman',
+                       'Surabaya, Jawa Timur', 'Kepulauan Riau', 'Desa Terpencil', 'Palembang'], dtype=object)
+    kota = cities[rng.integers(0, len(cities), rows)]
+    kota[rng.random(rows) < 0.05] = np.nan
+    lat = np.round(rng.uniform(-11, 6, rows), 4)
+    lon = np.round(rng.uniform(95, 141, rows), 4)
+    lat[rng.random(rows) < 0.6] = np.nan
+    lat[rng.random(rows) < 0.05] = 120.0
+    return df.assign(kota=pd.Series(kota, index=df.index, dtype=object), latitude=lat, longitude=lon)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def measure(fn, df, repeat, memory):
+    """Jalankan fn(df.copy()) beberapa kali, return (hasil, detik terbaik, peak MB atau None)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        data = df.copy()
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn(data)
+            best = min(best, time.perf_counter() - started)
+    peak = None
+    if memory:
+        data = df.copy()
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(data)
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def stages(scraper):
+    """
+    (nama tahap, fungsi lama, fungsi baru, penyiapan input dari frame mentah atau None,
+     penyesuaian output baru sebelum dibandingkan atau None)
+    """
+    mapped = lambda df: scraper.map_columns(legacy_normalize(df))
+    return [
+        ('normalize (blanks/trim/empty rows+cols)', legacy_normalize, scraper._normalize_frame, None, None),
+        ('rating/harga numeric validation', legacy_validate_numeric, scraper._validate_numeric_columns,
+         mapped, None),
+        # kategori baru bertipe category, isinya harus sama dengan list string versi lama
+        ('kategori from nama keywords', legacy_synthetic_columns, scraper.create_synthetic_columns,
+         mapped, lambda df: df.astype({'kategori': df['kategori'].cat.categories.dtype})),
+        ('coordinates (geocoding)', legacy_extract_coordinates, scraper.extract_coordinates,
+         lambda df: with_locations(mapped(df)), None),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--memory', action='store_true', help='ukur peak memory dengan tracemalloc')
+    args = parser.parse_args()
+
+    scraper = TourismDataScraper()
+    raw = make_frame(args.rows)
+    print(f"Data uji: {len(raw):,} rows x {len(raw.columns)} cols, pandas {pd.__version__}\n")
+
+    stage_list = stages(scraper)
+    header = f"{'tahap':<42} {'lama (s)':>10} {'baru (s)':>10} {'speedup':>9}"
+    if args.memory:
+        header += f" {'peak lama':>10} {'peak baru':>10}"
+    print(header)
+    print('-' * len(header))
+
+    for name, legacy_fn, new_fn, prepare, adapt in stage_list:
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = prepare(raw.copy()) if prepare else raw
+        old_result, old_time, old_peak = measure(legacy_fn, data, args.repeat, args.memory)
+        new_result, new_time, new_peak = measure(new_fn, data, args.repeat, args.memory)
+        pd.testing.assert_frame_equal(old_result, adapt(new_result) if adapt else new_result)
+        line = f"{name:<42} {old_time:>10.3f} {new_time:>10.3f} {old_time / new_time:>8.1f}x"
+        if args.memory:
+            line += f" {old_peak:>8.0f}MB {new_peak:>8.0f}MB"
+        print(line)
+
+    print("\nOutput lama dan baru identik untuk semua tahap.")
+
+
+if __name__ == '__main__':
+    main()
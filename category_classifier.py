@@ -0,0 +1,64 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class CategoryClassifier:
+    """
+    Klasifikasi kategori wisata dari teks (nama / deskripsi) berbasis keyword, tervektorisasi
+    Satu regex per kategori (keyword cocok sebagai substring, case-insensitive), kategori pertama yang cocok menang
+    Urutan dict keyword = prioritas; keyword bisa diganti/ditambah (Indonesia maupun Inggris)
+    """
+
+    DEFAULT_KEYWORDS = {
+        'beach': ['beach', 'pantai', 'laut', 'sea', 'coast', 'shore'],
+        'mountain': ['mountain', 'gunung', 'peak', 'alpine', 'hiking'],
+        'temple': ['temple', 'candi', 'shrine', 'pagoda', 'religious'],
+        'museum': ['museum', 'gallery', 'art', 'historical'],
+        'city': ['city', 'kota', 'town', 'urban', 'metropolitan'],
+        'nature': ['park', 'forest', 'nature', 'hutan', 'taman', 'alam'],
+        'water': ['lake', 'danau', 'waterfall', 'air terjun', 'geyser'],
+    }
+
+    def __init__(self, keywords=None, default='Attraction'):
+        """
+        keywords: {kategori: [keyword, ...]} (default DEFAULT_KEYWORDS), label hasil = kategori.title()
+        default: label jika tidak ada keyword yang cocok
+        """
+        self.keywords = dict(keywords if keywords is not None else self.DEFAULT_KEYWORDS)
+        self.default = default
+        self._patterns = [
+            re.compile('|'.join(re.escape(keyword.lower()) for keyword in sorted(keywords_, key=len, reverse=True)))
+            for keywords_ in self.keywords.values() if keywords_
+        ]
+        self.labels = [category.title() for category, keywords_ in self.keywords.items() if keywords_]
+
+    def _match(self, text):
+        """
+        Index label (urutan self.labels) per baris dari Series teks, -1 jika tidak cocok (NaN tidak pernah cocok)
+        Regex hanya dijalankan pada nilai unik (pd.factorize), hasilnya disebar lagi lewat kode
+        """
+        codes, uniques = pd.factorize(text)
+        lowered = pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str).str.lower()
+        conditions = [lowered.str.contains(pattern).to_numpy(dtype=bool) for pattern in self._patterns]
+        matched = np.select(conditions, np.arange(len(conditions)), default=-1) if conditions \
+            else np.full(len(lowered), -1)
+        # Kode -1 (NaN) mengambil elemen terakhir = -1
+        return np.append(matched, -1)[codes]
+
+    def classify(self, names, descriptions=None):
+        """
+        Klasifikasi per baris dari Series nama; descriptions (opsional) dipakai untuk baris
+        yang namanya tidak cocok dengan keyword mana pun. Return Series categorical (kategori yang muncul saja)
+        """
+        matched = self._match(names)
+        if descriptions is not None:
+            missing = matched == -1
+            if missing.any():
+                matched[missing] = self._match(descriptions[missing])
+        matched[matched == -1] = len(self.labels)
+        categories = pd.Index(self.labels + [self.default]).unique()
+        codes = categories.get_indexer(self.labels + [self.default])[matched]
+        kategori = pd.Categorical.from_codes(codes, categories=categories).remove_unused_categories()
+        return pd.Series(kategori, index=names.index, name='kategori')
@@ -0,0 +1,65 @@
+import re
+from functools import lru_cache
+
+
+class ColumnMatcher:
+    """
+    Matcher nama kolom -> kolom standar, di-compile sekali dari mapping {kolom standar: [alias, ...]}
+    Per kolom standar satu regex alternation (alias > 2 karakter, cocok sebagai substring) + set alias exact
+    Hasil per nama kolom dan per skema (tuple nama kolom) di-cache LRU
+    """
+
+    def __init__(self, mapping, cache_size=256):
+        self.standard_columns = tuple(mapping)
+        self._exact = {standard: frozenset(aliases) for standard, aliases in mapping.items()}
+        self._patterns = {
+            standard: self._alternation(alias for alias in aliases if len(alias) > 2)
+            for standard, aliases in mapping.items()
+        }
+        self._any_alias = self._alternation(
+            alias for aliases in mapping.values() for alias in aliases if len(alias) > 2
+        )
+        self._matches = lru_cache(maxsize=cache_size * 8)(self._match_column)
+        self._rename_map = lru_cache(maxsize=cache_size)(self._build_rename_map)
+
+    @staticmethod
+    def _alternation(aliases):
+        aliases = sorted(set(aliases), key=len, reverse=True)
+        return re.compile('|'.join(re.escape(alias) for alias in aliases)) if aliases else None
+
+    def _match_column(self, column):
+        """Kolom standar yang cocok untuk satu nama kolom, urut sesuai prioritas mapping"""
+        if not isinstance(column, str):
+            return ()
+        col_lower = column.lower().strip()
+        return tuple(
+            standard for standard in self.standard_columns
+            if col_lower in self._exact[standard]
+            or (self._patterns[standard] is not None and self._patterns[standard].search(col_lower))
+        )
+
+    def _build_rename_map(self, columns):
+        # Prioritas sama seperti sebelumnya: per kolom standar (urut mapping), kolom pertama yang cocok
+        # dipetakan, kecuali kolom standar itu sudah ada; kolom standar berikutnya boleh menimpa
+        present = set(columns)
+        matches = [self._matches(col) for col in columns]
+        mapped = {}
+        for standard in self.standard_columns:
+            if standard in present:
+                continue
+            for col, matched in zip(columns, matches):
+                if standard in matched:
+                    mapped[col] = standard
+                    break
+        return tuple(mapped.items())
+
+    def rename_map(self, columns):
+        """Mapping {kolom asli: kolom standar} untuk daftar kolom (hasil di-cache per skema)"""
+        return dict(self._rename_map(tuple(columns)))
+
+    def is_known(self, text):
+        """Text sama dengan nama kolom standar atau mengandung salah satu alias"""
+        return text in self._exact or (self._any_alias is not None and self._any_alias.search(text) is not None)
+
+    def cache_info(self):
+        return self._rename_map.cache_info()
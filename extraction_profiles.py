@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+from functools import lru_cache
+
+import pandas as pd
+import soupsieve as sv
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+
+@lru_cache(maxsize=512)
+def compile_css(selector):
+    """Compile CSS selector sekali (soupsieve), hasilnya di-cache"""
+    return sv.compile(selector)
+
+
+@lru_cache(maxsize=512)
+def compile_xpath(expression):
+    """Compile XPath sekali (lxml), hasilnya di-cache"""
+    if etree is None:
+        raise ImportError("lxml diperlukan untuk selector XPath")
+    return etree.XPath(expression)
+
+
+class ExtractionProfile:
+    """
+    Profil ekstraksi satu situs: selector item (card) + selector per field
+    Selector diawali 'xpath:' memakai XPath (butuh lxml), selain itu CSS
+    Item XPath -> semua field juga XPath (relatif terhadap card, misal 'xpath:.//h3')
+
+    fields: {'nama': 'h3', 'rating': {'selector': 'span.score', 'attr': 'data-value'}}
+    """
+
+    def __init__(self, item, fields):
+        self.item = item
+        self.fields = {name: self._normalize_field(spec) for name, spec in fields.items()}
+        self.uses_xpath = self._is_xpath(item)
+        if any(self._is_xpath(f['selector']) != self.uses_xpath for f in self.fields.values()):
+            raise ValueError("Selector item dan field harus sama-sama CSS atau sama-sama XPath")
+        # Compile semua selector sekarang supaya error selector langsung ketahuan
+        self._item_selector = self._compile(item)
+        self._field_selectors = {name: self._compile(f['selector']) for name, f in self.fields.items()}
+
+    @staticmethod
+    def _normalize_field(spec):
+        if isinstance(spec, str):
+            return {'selector': spec, 'attr': None}
+        return {'selector': spec['selector'], 'attr': spec.get('attr')}
+
+    @staticmethod
+    def _is_xpath(selector):
+        return selector.startswith('xpath:')
+
+    def _compile(self, selector):
+        if self._is_xpath(selector):
+            return compile_xpath(selector[len('xpath:'):])
+        return compile_css(selector)
+
+    def extract_soup(self, soup):
+        """Ekstrak semua card dari BeautifulSoup document (profil CSS). Return DataFrame atau None"""
+        records = []
+        for card in self._item_selector.select(soup):
+            record = {}
+            for name, selector in self._field_selectors.items():
+                element = selector.select_one(card)
+                if element is None:
+                    continue
+                attr = self.fields[name]['attr']
+                value = element.get(attr) if attr else element.get_text(' ', strip=True)
+                if value:
+                    record[name] = value
+            if record:
+                records.append(record)
+        return pd.DataFrame(records, columns=list(self.fields)) if records else None
+
+    def extract_html(self, html, encoding=None):
+        """
+        Ekstrak card dari HTML mentah dengan lxml (untuk profil XPath). Return DataFrame atau None
+        html boleh bytes, encoding diberikan langsung ke parser lxml
+        """
+        if lxml_html is None:
+            return None
+        parser = lxml_html.HTMLParser(encoding=encoding) if isinstance(html, bytes) and encoding else None
+        tree = lxml_html.fromstring(html, parser=parser)
+        records = []
+        for card in self._item_selector(tree):
+            record = {}
+            for name, selector in self._field_selectors.items():
+                found = selector(card)
+                if not found:
+                    continue
+                element = found[0]
+                attr = self.fields[name]['attr']
+                if isinstance(element, str):
+                    value = element.strip()
+                elif attr:
+                    value = element.get(attr)
+                else:
+                    value = ' '.join(element.text_content().split())
+                if value:
+                    record[name] = value
+            if record:
+                records.append(record)
+        return pd.DataFrame(records, columns=list(self.fields)) if records else None
+
+
+class ExtractionProfileRegistry:
+    """Registry profil ekstraksi per domain (domain induk ikut cocok, 'www.' diabaikan)"""
+
+    def __init__(self, profiles=None, path=None):
+        """
+        profiles: {domain: {'item': selector, 'fields': {...}}}
+        path: file JSON berisi profil dengan format yang sama (opsional)
+        """
+        self._profiles = {}
+        self._lock = threading.Lock()
+        for domain, spec in (profiles or {}).items():
+            self.register(domain, spec['item'], spec['fields'])
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def _normalize_domain(domain):
+        domain = domain.lower().split(':')[0]
+        return domain[4:] if domain.startswith('www.') else domain
+
+    def register(self, domain, item, fields):
+        profile = ExtractionProfile(item, fields)
+        with self._lock:
+            self._profiles[self._normalize_domain(domain)] = profile
+        return profile
+
+    def load(self, path):
+        """Muat profil dari file JSON"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                specs = json.load(f)
+            for domain, spec in specs.items():
+                self.register(domain, spec['item'], spec['fields'])
+            print(f"[PROFILE] Loaded {len(specs)} extraction profiles from {path}")
+        except Exception as e:
+            print(f"[PROFILE] Failed to load extraction profiles: {e}")
+
+    def get(self, domain):
+        """Profil untuk domain atau domain induknya, None jika tidak ada"""
+        if not domain:
+            return None
+        parts = self._normalize_domain(domain).split('.')
+        with self._lock:
+            for i in range(len(parts) - 1):
+                profile = self._profiles.get('.'.join(parts[i:]))
+                if profile is not None:
+                    return profile
+        return None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._profiles)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_float_dtype, is_object_dtype, is_string_dtype
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+
+def _arrow_string_dtype():
+    """String dtype berbasis Arrow dengan semantik NaN (seperti object), None jika pyarrow/pandas tidak mendukung"""
+    if pyarrow is None:
+        return None
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)  # pandas >= 2.3
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype('pyarrow_numpy')  # pandas 2.1 / 2.2
+    except (TypeError, ValueError):
+        return None
+
+
+ARROW_STRING_DTYPE = _arrow_string_dtype()
+
+
+def compact_dtypes(df, category_ratio=0.5):
+    """
+    Ubah dtype kolom ke bentuk hemat memori (in place pada df), return (df, bytes sebelum, bytes sesudah):
+    - teks dengan nilai unik <= category_ratio x jumlah baris -> category
+    - teks lainnya -> string Arrow (jika pyarrow tersedia)
+    - float64 -> float32 hanya jika semua nilai tetap persis sama (kolom yang seluruhnya NaN dibiarkan)
+    - category: kategori yang tidak dipakai lagi dibuang
+    Kolom teks campuran (angka + string) dibiarkan apa adanya
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    for position, dtype in enumerate(df.dtypes):
+        col = df.iloc[:, position]
+        if isinstance(dtype, pd.CategoricalDtype):
+            df.isetitem(position, col.cat.remove_unused_categories())
+        elif is_float_dtype(dtype) and dtype == np.float64 and col.notna().any():
+            compact = col.astype(np.float32)
+            if np.array_equal(compact.to_numpy(dtype=np.float64), col.to_numpy(), equal_nan=True):
+                df.isetitem(position, compact)
+        elif is_object_dtype(dtype) or is_string_dtype(dtype):
+            if infer_dtype(col, skipna=True) not in ('string', 'empty'):
+                continue
+            if col.nunique() <= len(col) * category_ratio:
+                df.isetitem(position, col.astype('category'))
+            elif ARROW_STRING_DTYPE is not None and dtype != ARROW_STRING_DTYPE:
+                df.isetitem(position, col.astype(ARROW_STRING_DTYPE))
+    return df, before, int(df.memory_usage(deep=True).sum())
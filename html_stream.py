@@ -0,0 +1,167 @@
+import codecs
+from html.parser import HTMLParser
+
+import pandas as pd
+
+
+class TableStreamParser(HTMLParser):
+    """
+    Parser HTML berbasis event untuk tabel sangat besar
+    Tidak membangun DOM tree: baris <tr> dikumpulkan lalu dikeluarkan per batch
+    Hanya tabel top-level yang dibaca (isi nested table diabaikan)
+    """
+
+    def __init__(self, batch_size=5000):
+        super().__init__(convert_charrefs=True)
+        self.batch_size = batch_size
+        self.table_index = -1
+        self._depth = 0
+        self._in_thead = False
+        self._row = None
+        self._row_in_thead = False
+        self._cell = None
+        self._cell_span = 1
+        self._headers = {}
+        self._header_from_thead = set()
+        self._rows = []
+        self._ready = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self._depth += 1
+            if self._depth == 1:
+                self._flush_rows()
+                self.table_index += 1
+            return
+        if self._depth != 1:
+            return
+        if tag == 'thead':
+            self._in_thead = True
+        elif tag in ('tbody', 'tfoot'):
+            self._in_thead = False
+        elif tag == 'tr':
+            self._end_row()
+            self._row = []
+            self._row_in_thead = self._in_thead
+        elif tag in ('td', 'th'):
+            if self._row is None:
+                self._row = []
+                self._row_in_thead = self._in_thead
+            self._end_cell()
+            self._cell = []
+            try:
+                self._cell_span = max(1, min(int(dict(attrs).get('colspan') or 1), 100))
+            except ValueError:
+                self._cell_span = 1
+
+    def handle_endtag(self, tag):
+        if tag == 'table':
+            if self._depth == 1:
+                self._end_row()
+                self._flush_rows()
+                self._in_thead = False
+            self._depth = max(0, self._depth - 1)
+            return
+        if self._depth != 1:
+            return
+        if tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_row()
+        elif tag == 'thead':
+            self._end_row()
+            self._in_thead = False
+
+    def handle_data(self, data):
+        if self._cell is not None and self._depth == 1:
+            text = data.strip()
+            if text:
+                self._cell.append(text)
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._row.extend([''.join(self._cell)] * self._cell_span)
+            self._cell = None
+            self._cell_span = 1
+
+    def _end_row(self):
+        self._end_cell()
+        row, self._row = self._row, None
+        if not row:
+            return
+        index = self.table_index
+        if self._row_in_thead:
+            # Header = baris terakhir di <thead>
+            self._headers[index] = row
+            self._header_from_thead.add(index)
+        elif index not in self._headers:
+            self._headers[index] = row
+        else:
+            self._rows.append(row)
+            if len(self._rows) >= self.batch_size:
+                self._flush_rows()
+
+    def _flush_rows(self):
+        if self._rows and self.table_index in self._headers:
+            self._ready.append((self.table_index, self._headers[self.table_index], self._rows))
+        self._rows = []
+
+    def pop_batches(self):
+        """Ambil batch yang sudah siap: list of (table_index, headers, rows)"""
+        ready, self._ready = self._ready, []
+        return ready
+
+    def close(self):
+        super().close()
+        self._end_row()
+        self._flush_rows()
+
+
+def _batch_to_dataframe(headers, rows):
+    width = len(headers)
+    return pd.DataFrame([(row + [''] * width)[:width] for row in rows], columns=headers)
+
+
+def iter_table_batches(chunks, encoding='utf-8', batch_size=5000):
+    """
+    Generator: parse potongan body (bytes) secara incremental
+    Yield (table_index, DataFrame batch) tiap kali batch_size baris terkumpul
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    parser = TableStreamParser(batch_size=batch_size)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(decoder.decode(chunk))
+        for table_index, headers, rows in parser.pop_batches():
+            yield table_index, _batch_to_dataframe(headers, rows)
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    for table_index, headers, rows in parser.pop_batches():
+        yield table_index, _batch_to_dataframe(headers, rows)
+
+
+class StreamingTableBuilder:
+    """Kumpulkan batch DataFrame per tabel, lalu bangun tabel dengan baris terbanyak"""
+
+    def __init__(self):
+        self._batches = {}
+        self._rows = {}
+
+    def add(self, table_index, batch):
+        self._batches.setdefault(table_index, []).append(batch)
+        self._rows[table_index] = self._rows.get(table_index, 0) + len(batch)
+
+    @property
+    def total_rows(self):
+        return sum(self._rows.values())
+
+    def build(self, min_rows=3, min_cols=2):
+        """Return (table_index, DataFrame) untuk tabel terbesar yang valid, atau (None, None)"""
+        for table_index in sorted(self._rows, key=lambda i: (-self._rows[i], i)):
+            batches = self._batches[table_index]
+            if self._rows[table_index] < min_rows or len(batches[0].columns) < min_cols:
+                continue
+            df = pd.concat(batches, ignore_index=True) if len(batches) > 1 else batches[0]
+            return table_index, df
+        return None, None
@@ -0,0 +1,36 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class LocationMatcher:
+    """
+    Cocokkan teks lokasi ke koordinat, tervektorisasi per nilai unik kolom
+    Prioritas sama seperti loop per baris sebelumnya: tempat wisata (urutan dict) dulu,
+    lalu provinsi dengan nama terpanjang dulu (panjang sama: urutan dict); nama dicari sebagai substring
+    """
+
+    def __init__(self, place_coords, province_coords):
+        provinces = sorted(province_coords.items(), key=lambda item: len(item[0]), reverse=True)
+        entries = list(place_coords.items()) + provinces
+        self.coords = np.array([coords for _, coords in entries], dtype=float)
+        # Nama sama di dua tabel (misal 'Bali'): prioritas terkecil yang dipakai
+        self._priority = {}
+        for index, (name, _) in enumerate(entries):
+            self._priority.setdefault(name.lower(), index)
+        # Lookahead: di setiap posisi teks diambil alternatif pertama (= prioritas terbaik) yang cocok,
+        # termasuk match yang tumpang tindih; minimum antar posisi = prioritas terbaik di seluruh teks
+        names = sorted(self._priority, key=self._priority.get)
+        self._pattern = re.compile('(?=(' + '|'.join(re.escape(name) for name in names) + '))')
+
+    def _best(self, names):
+        return min((self._priority[name] for name in names), default=-1)
+
+    def match(self, values):
+        """Index baris self.coords per nilai Series, -1 jika tidak ada nama yang cocok (NaN tidak pernah cocok)"""
+        codes, uniques = pd.factorize(values)
+        text = pd.Series(np.asarray(uniques, dtype=object), dtype=object).map(str).str.lower()
+        best = text.str.findall(self._pattern).map(self._best).to_numpy(dtype=np.int64)
+        # Kode -1 (NaN) mengambil elemen terakhir = -1
+        return np.append(best, -1)[codes]
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# Angka pertama di teks (tanda minus ikut) + suffix opsional (10k, 25rb, 1,5 jt)
+PRICE_RE = r'(?P<sign>-)?(?P<number>\d[\d.,]*)(?:\s*(?P<suffix>ribu|juta|rb|jt|k)(?![a-z]))?'
+FREE_RE = r'\b(?:gratis|free)\b'
+PRICE_SUFFIXES = {'k': 1e3, 'rb': 1e3, 'ribu': 1e3, 'jt': 1e6, 'juta': 1e6}
+
+# Rating "4,7/5", "8 dari 10", "4.5 out of 5" -> skala 0-5; selain itu angka pertama ("4.5 ★")
+RATING_FRACTION_RE = r'(?P<value>\d+(?:[.,]\d+)?)\s*(?:/|dari|out of|of)\s*(?P<scale>\d+(?:[.,]\d+)?)'
+RATING_RE = r'(?P<value>\d+(?:[.,]\d+)?)'
+
+
+def _lowered_text(values):
+    return values.astype(object).where(values.notna(), '').astype(str).str.lower()
+
+
+def _per_unique(parse, values):
+    """Jalankan parse pada nilai unik saja (pd.factorize), hasil disebar lagi ke semua baris; NaN -> NaN"""
+    codes, uniques = pd.factorize(values)
+    parsed = parse(pd.Series(np.asarray(uniques, dtype=object), dtype=object)).to_numpy(dtype=float)
+    # Kode -1 (NaN) mengambil elemen terakhir = NaN
+    return pd.Series(np.append(parsed, np.nan)[codes], index=values.index)
+
+
+def _normalize_number(numbers):
+    """
+    Series string angka dengan pemisah '.'/',' -> float
+    Pemisah terakhir dianggap desimal, kecuali pemisah itu muncul lebih dari sekali,
+    atau tunggal dengan tepat 3 digit di belakangnya dan tanpa pemisah jenis lain (25.000, 1,500)
+    """
+    numbers = numbers.str.rstrip('.,')
+    last = numbers.str.extract(r'([.,])\d*$', expand=False)
+    digits_after = numbers.str.extract(r'[.,](\d*)$', expand=False).str.len()
+    same_count = np.where(last == '.', numbers.str.count(r'\.'), numbers.str.count(','))
+    other_present = np.where(last == '.', numbers.str.contains(',', regex=False),
+                             numbers.str.contains('.', regex=False)).astype(bool)
+    grouped = (same_count > 1) | ((digits_after == 3) & ~other_present)
+    decimal = last.where(~grouped)
+    # Semua pemisah dibuang, lalu dibagi 10^(jumlah digit di belakang pemisah desimal)
+    decimals = digits_after.where(decimal.notna(), 0).astype(float)
+    value = pd.to_numeric(numbers.str.replace(r'[.,]', '', regex=True), errors='coerce')
+    return value / np.power(10.0, decimals)
+
+
+def parse_price(values):
+    """
+    Harga dari teks: 'Rp 25.000', 'IDR 10k', '25rb', '1,5 jt', 'Rp 25.000,00', 'Gratis'/'Free' (tanpa angka) -> 0
+    Return Series float (NaN jika tidak ada angka)
+    """
+    return _per_unique(_parse_price, values)
+
+
+def _parse_price(values):
+    text = _lowered_text(values)
+    found = text.str.extract(PRICE_RE)
+    number = _normalize_number(found['number'].fillna(''))
+    multiplier = found['suffix'].map(PRICE_SUFFIXES).fillna(1.0).astype(float)
+    # Tanda minus dipertahankan supaya harga negatif tetap ditolak validasi range
+    price = number * multiplier * np.where(found['sign'].notna(), -1.0, 1.0)
+    # 'Gratis'/'Free' hanya berarti 0 jika tidak ada nominal ('Rp 50.000 (gratis anak)' tetap 50000)
+    return price.mask(price.isna() & text.str.contains(FREE_RE), 0.0)
+
+
+def parse_rating(values, scale=5):
+    """
+    Rating dari teks: '4,7/5', '8 dari 10' (diskalakan ke 0-scale), '4.5 ★', '4,5'
+    Return Series float (NaN jika tidak ada angka)
+    """
+    return _per_unique(lambda unique: _parse_rating(unique, scale), values)
+
+
+def _parse_rating(values, scale):
+    text = _lowered_text(values)
+    fraction = text.str.extract(RATING_FRACTION_RE)
+    single = text.str.extract(RATING_RE)['value']
+    value = pd.to_numeric(fraction['value'].fillna(single).str.replace(',', '.', regex=False), errors='coerce')
+    denominator = pd.to_numeric(fraction['scale'].str.replace(',', '.', regex=False), errors='coerce')
+    scaled = value / denominator.where(denominator > 0) * scale
+    return scaled.where(fraction['scale'].notna(), value)
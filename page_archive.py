@@ -0,0 +1,116 @@
+import gzip
+import json
+import os
+import threading
+import time
+
+
+class PageArchive:
+    """
+    Arsip append-only halaman mentah yang sudah di-fetch (mirip WARC)
+    Tiap record = satu gzip member (header JSON + body) di file segment, posisinya dicatat di index.jsonl
+    Dipakai untuk memproses ulang halaman (mapping/cleaning baru) tanpa request ulang ke network
+    """
+
+    INDEX_FILE = 'index.jsonl'
+
+    def __init__(self, archive_dir, segment_max_bytes=256 * 1024 * 1024):
+        self.archive_dir = archive_dir
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(archive_dir, exist_ok=True)
+        self._index_path = os.path.join(archive_dir, self.INDEX_FILE)
+        self._latest = {}
+        self._count = 0
+        self._load_index()
+        self._segment = self._current_segment()
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Baris terakhir bisa terpotong jika proses mati saat menulis
+                    continue
+                self._latest[entry['url']] = entry
+                self._count += 1
+
+    def _segment_path(self, segment):
+        return os.path.join(self.archive_dir, f"pages-{segment:05d}.warc.gz")
+
+    def _current_segment(self):
+        segment = max((entry['segment'] for entry in self._latest.values()), default=1)
+        while os.path.exists(self._segment_path(segment + 1)):
+            segment += 1
+        return segment
+
+    def append(self, url, body, headers=None, status_code=200):
+        """Tambah satu record (body bytes). Return entry index"""
+        header = {
+            'url': url,
+            'fetched_at': time.time(),
+            'status_code': status_code,
+            'headers': {key.lower(): value for key, value in (headers or {}).items()},
+        }
+        record = gzip.compress(json.dumps(header).encode('utf-8') + b'\n' + body, compresslevel=6)
+
+        with self._lock:
+            path = self._segment_path(self._segment)
+            if os.path.exists(path) and os.path.getsize(path) + len(record) > self.segment_max_bytes:
+                self._segment += 1
+                path = self._segment_path(self._segment)
+            with open(path, 'ab') as f:
+                offset = f.tell()
+                f.write(record)
+            entry = {
+                'url': url,
+                'fetched_at': header['fetched_at'],
+                'segment': self._segment,
+                'offset': offset,
+                'length': len(record),
+                'size': len(body),
+                'content_type': header['headers'].get('content-type', ''),
+            }
+            with open(self._index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._latest[url] = entry
+            self._count += 1
+        return entry
+
+    def read(self, entry):
+        """Baca record dari entry index. Return (header dict, body bytes)"""
+        with open(self._segment_path(entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            data = gzip.decompress(f.read(entry['length']))
+        header, _, body = data.partition(b'\n')
+        return json.loads(header), body
+
+    def get(self, url):
+        """Record terbaru untuk URL: (header dict, body bytes) atau None"""
+        with self._lock:
+            entry = self._latest.get(url)
+        return self.read(entry) if entry is not None else None
+
+    def entries(self, urls=None):
+        """Entry index terbaru per URL (semua, atau hanya URL yang diminta)"""
+        with self._lock:
+            if urls is None:
+                return list(self._latest.values())
+            return [self._latest[url] for url in urls if url in self._latest]
+
+    def total_bytes(self):
+        """Ukuran seluruh segment di disk"""
+        return sum(os.path.getsize(os.path.join(self.archive_dir, name))
+                   for name in os.listdir(self.archive_dir) if name.endswith('.warc.gz'))
+
+    @property
+    def record_count(self):
+        """Jumlah record (termasuk versi lama URL yang sama)"""
+        return self._count
+
+    def __len__(self):
+        with self._lock:
+            return len(self._latest)
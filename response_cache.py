@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+
+class ResponseCache:
+    """
+    Cache HTTP response di disk, key berdasarkan URL
+    Menyimpan headers, ETag, Last-Modified dan DataFrame hasil cleaning
+    sehingga response 304 tidak perlu di-download dan di-parse ulang (body mentah ada di arsip halaman)
+    """
+
+    def __init__(self, cache_dir='.scrape_cache', ttl=3600, max_bytes=200 * 1024 * 1024):
+        """
+        ttl: umur entry (detik) sebelum wajib revalidasi ke server
+        max_bytes: batas total ukuran cache, entry paling lama tidak dipakai dihapus dulu
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _path(self, key, ext):
+        return os.path.join(self.cache_dir, f"{key}.{ext}")
+
+    def _load_index(self):
+        """Baca semua metadata entry yang ada di disk"""
+        index = {}
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, filename), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                index[filename[:-5]] = meta
+            except Exception as e:
+                print(f"[CACHE] Skipping unreadable entry {filename}: {e}")
+        return index
+
+    def get(self, url):
+        """Return metadata entry untuk URL atau None"""
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            return dict(meta) if meta else None
+
+    def is_fresh(self, entry):
+        """Entry masih dalam TTL, boleh dipakai tanpa request ke server"""
+        return entry is not None and (time.time() - entry['stored_at']) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Header If-None-Match / If-Modified-Since untuk revalidasi"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_dataframe(self, entry):
+        """Load DataFrame hasil cleaning dari entry, None jika gagal"""
+        key = entry['key']
+        try:
+            df = pd.read_pickle(self._path(key, 'pkl'))
+        except Exception as e:
+            print(f"[CACHE] Failed to load cached DataFrame: {e}")
+            self._remove(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key]['accessed_at'] = time.time()
+        return df
+
+    def store(self, url, headers, df):
+        """Simpan headers response dan DataFrame hasil cleaning"""
+        key = self._key(url)
+        headers = dict(headers or {})
+        lowered = {k.lower(): v for k, v in headers.items()}
+        try:
+            df.to_pickle(self._path(key, 'pkl'))
+            now = time.time()
+            meta = {
+                'key': key,
+                'url': url,
+                'stored_at': now,
+                'accessed_at': now,
+                'etag': lowered.get('etag'),
+                'last_modified': lowered.get('last-modified'),
+                'headers': headers,
+                'size': os.path.getsize(self._path(key, 'pkl')),
+            }
+            with open(self._path(key, 'json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except Exception as e:
+            print(f"[CACHE] Failed to store {url}: {e}")
+            self._remove(key)
+            return
+
+        with self._lock:
+            self._index[key] = meta
+        self._evict()
+
+    def touch(self, url):
+        """Perpanjang TTL entry setelah server menjawab 304 Not Modified"""
+        key = self._key(url)
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is None:
+                return
+            meta['stored_at'] = meta['accessed_at'] = time.time()
+            meta = dict(meta)
+        try:
+            with open(self._path(key, 'json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"[CACHE] Failed to update entry for {url}: {e}")
+
+    def total_bytes(self):
+        with self._lock:
+            return sum(meta.get('size', 0) for meta in self._index.values())
+
+    def _remove(self, key):
+        with self._lock:
+            self._index.pop(key, None)
+        # 'body': file dari versi cache lama yang masih menyimpan body mentah
+        for ext in ('json', 'body', 'pkl'):
+            try:
+                os.remove(self._path(key, ext))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Hapus entry paling lama tidak diakses sampai total ukuran <= max_bytes"""
+        with self._lock:
+            total = sum(meta.get('size', 0) for meta in self._index.values())
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for key, meta in sorted(self._index.items(), key=lambda item: item[1].get('accessed_at', 0)):
+                if total <= self.max_bytes:
+                    break
+                total -= meta.get('size', 0)
+                victims.append(key)
+        for key in victims:
+            self._remove(key)
+        if victims:
+            print(f"[CACHE] Evicted {len(victims)} entries (limit {self.max_bytes} bytes)")
+
+    def clear(self):
+        """Hapus semua entry"""
+        with self._lock:
+            keys = list(self._index)
+        for key in keys:
+            self._remove(key)
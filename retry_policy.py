@@ -0,0 +1,156 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+
+class RetryPolicy:
+    """
+    Kebijakan retry: exponential backoff + jitter, hanya untuk error yang bisa pulih
+    (timeout, connection error, HTTP 408/425/429/5xx) dan menghormati header Retry-After
+    """
+
+    RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=30.0, jitter=True):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def is_retryable(self, exc):
+        """True jika error bersifat sementara dan layak di-retry"""
+        if isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                            requests.exceptions.ChunkedEncodingError)):
+            return True
+        if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+            return exc.response.status_code in self.RETRYABLE_STATUS
+        return False
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Parse header Retry-After (detik atau HTTP-date), return detik atau None"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def compute_delay(self, attempt, retry_after=None):
+        """Delay sebelum attempt berikutnya (attempt dimulai dari 0)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        if self.jitter:
+            # Full jitter: sebar retry supaya tidak serentak menghantam host yang sama
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay_for(self, exc, attempt):
+        """Delay untuk exception tertentu, memakai Retry-After jika ada"""
+        retry_after = None
+        response = getattr(exc, 'response', None)
+        if response is not None:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+        return self.compute_delay(attempt, retry_after)
+
+
+class TokenBucket:
+    """Token bucket: rata-rata `rate` request/detik dengan burst maksimal `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Ambil satu token, tunggu jika bucket kosong. Return lama menunggu (detik)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class RateLimiter:
+    """Rate limiter per host (satu token bucket per host)"""
+
+    def __init__(self, rate=2.0, burst=4):
+        """rate: request/detik per host (None/0 = tanpa limit), burst: kapasitas bucket"""
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host):
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.acquire()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per host
+    closed -> open setelah `failure_threshold` kegagalan berturut-turut,
+    open -> half-open setelah `reset_timeout` detik (satu request percobaan),
+    half-open -> closed jika sukses, kembali open jika gagal
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host):
+        return self._hosts.setdefault(host, {'state': 'closed', 'failures': 0, 'opened_at': 0.0})
+
+    def allow(self, host):
+        """True jika request ke host boleh dilakukan"""
+        with self._lock:
+            state = self._state(host)
+            if state['state'] == 'closed':
+                return True
+            if state['state'] == 'open' and time.monotonic() - state['opened_at'] >= self.reset_timeout:
+                state['state'] = 'half-open'
+                return True
+            return False
+
+    def record_success(self, host):
+        with self._lock:
+            state = self._state(host)
+            state['state'] = 'closed'
+            state['failures'] = 0
+
+    def record_failure(self, host):
+        with self._lock:
+            state = self._state(host)
+            state['failures'] += 1
+            if state['state'] == 'half-open' or state['failures'] >= self.failure_threshold:
+                if state['state'] != 'open':
+                    print(f"[BREAKER] Circuit opened for {host} after {state['failures']} failures")
+                state['state'] = 'open'
+                state['opened_at'] = time.monotonic()
+
+    def state(self, host):
+        with self._lock:
+            return self._state(host)['state']
@@ -0,0 +1,154 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+
+class ScrapeJob:
+    """Satu job scraping di background: status, progress, hasil parsial dan hasil akhir"""
+
+    def __init__(self, description=''):
+        self.id = uuid.uuid4().hex[:12]
+        self.description = description
+        self.status = 'queued'
+        self.completed = 0
+        self.total = 0
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self._partial = []
+        self._partial_rows = 0
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self):
+        """Progress 0.0 - 1.0"""
+        if self.status == 'done':
+            return 1.0
+        return min(self.completed / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def is_running(self):
+        return self.status in ('queued', 'running')
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        """Minta job berhenti (URL yang sedang diproses tetap diselesaikan)"""
+        self.cancel_event.set()
+
+    def update(self, completed=None, total=None, message=None):
+        with self._lock:
+            if completed is not None:
+                self.completed = completed
+            if total is not None:
+                self.total = total
+            if message is not None:
+                self.message = message
+
+    def add_partial(self, df):
+        """Tambah DataFrame hasil parsial (misal hasil satu URL yang sudah selesai)"""
+        if df is None or len(df) == 0:
+            return
+        with self._lock:
+            self._partial.append(df)
+            self._partial_rows += len(df)
+
+    @property
+    def partial_rows(self):
+        return self._partial_rows
+
+    def partial_dataframe(self):
+        """Gabungan semua hasil parsial atau None"""
+        with self._lock:
+            frames = list(self._partial)
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True, sort=False)
+
+    def progress_callback(self, completed, total, url, df, status):
+        """Callback untuk TourismDataScraper.scrape_many"""
+        self.update(completed=completed, total=total,
+                    message=f"{url}: {status.get('status')} ({status.get('rows', 0)} rows)")
+        self.add_partial(df)
+
+
+class ScrapeJobManager:
+    """
+    Menjalankan job scraping di thread pool, terpisah dari script Streamlit
+    Dipakai bersama oleh semua session (st.cache_resource), job diakses lewat ID
+    """
+
+    def __init__(self, max_workers=4, max_finished_jobs=50, finished_ttl=3600):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self.max_finished_jobs = max_finished_jobs
+        self.finished_ttl = finished_ttl
+
+    def submit(self, fn, *args, description='', **kwargs):
+        """
+        Jalankan fn(job, *args, **kwargs) di background
+        Return: job ID. Nilai return fn disimpan di job.result
+        """
+        job = ScrapeJob(description=description)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        print(f"[JOB] Submitted job {job.id}: {description}")
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = 'cancelled' if job.cancelled else 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+            print(f"[JOB] Job {job.id} failed: {e}")
+        finally:
+            job.finished_at = time.time()
+        print(f"[JOB] Job {job.id} finished with status {job.status}")
+
+    def get(self, job_id):
+        """Return ScrapeJob atau None"""
+        if not job_id:
+            return None
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def list_jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _prune(self):
+        """Buang job selesai yang sudah lama atau melebihi batas jumlah"""
+        now = time.time()
+        finished = sorted((job for job in self._jobs.values() if not job.is_running),
+                          key=lambda job: job.finished_at or 0)
+        expired = [job for job in finished if now - (job.finished_at or now) > self.finished_ttl]
+        overflow = finished[:max(0, len(finished) - self.max_finished_jobs)]
+        for job in expired + overflow:
+            self._jobs.pop(job.id, None)
+
+    def shutdown(self):
+        for job in self.list_jobs():
+            job.cancel()
+        self._executor.shutdown(wait=False)
@@ -1,12 +1,92 @@
 import pandas as pd
 import numpy as np
+from pandas.api.types import infer_dtype, is_float_dtype, is_integer_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import re
-from urllib.parse import urljoin
-from io import StringIO
+import hashlib
+import json
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urljoin, urlparse, parse_qs
+import io
+import codecs
+import gzip
+import xml.etree.ElementTree as ET
 import random
+from response_cache import ResponseCache
+from retry_policy import RetryPolicy, RateLimiter, CircuitBreaker
+from strategy_profiles import StrategyProfileStore
+from extraction_profiles import ExtractionProfileRegistry, compile_css
+from column_matcher import ColumnMatcher
+from category_classifier import CategoryClassifier
+from numeric_parsing import parse_price, parse_rating
+from frame_dtypes import compact_dtypes
+from location_matcher import LocationMatcher
+from html_stream import iter_table_batches, StreamingTableBuilder
+from page_archive import PageArchive
+from text_decoding import declared_charset, sniff_encoding
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+class DownloadTooLarge(Exception):
+    """Ukuran response melebihi batas max_bytes scraper"""
+
+
+class _BudgetedStream(io.RawIOBase):
+    """Wrapper stream yang menghitung byte terbaca dan abort jika melebihi budget"""
+    
+    def __init__(self, raw, max_bytes=None):
+        self._raw = raw
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = self._raw.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        self.bytes_read += n
+        if self.max_bytes and self.bytes_read > self.max_bytes:
+            raise DownloadTooLarge(f"Download melebihi batas {self.max_bytes} bytes")
+        return n
+
+
+class _SeenUrls:
+    """Set URL yang sudah dikunjungi, disimpan sebagai hash 64-bit (hemat memori)"""
+    
+    def __init__(self):
+        self._hashes = set()
+    
+    @staticmethod
+    def _normalize(url):
+        parts = urlparse(url)
+        query = '&'.join(sorted(parts.query.split('&'))) if parts.query else ''
+        path = parts.path.rstrip('/') or '/'
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}?{query}"
+    
+    def add(self, url):
+        """Tambah URL, return True jika belum pernah dilihat"""
+        digest = hashlib.blake2b(self._normalize(url).encode('utf-8'), digest_size=8).digest()
+        key = int.from_bytes(digest, 'big')
+        if key in self._hashes:
+            return False
+        self._hashes.add(key)
+        return True
+    
+    def __len__(self):
+        return len(self._hashes)
+
 
 class TourismDataScraper:
     """
@@ -27,8 +107,148 @@ class TourismDataScraper:
         'Sulawesi Barat', 'Maluku', 'Maluku Utara', 'Papua', 'Papua Barat'
     ]
     
-    def __init__(self):
+    # Alias nama kolom generic -> kolom standar pariwisata
+    COLUMN_MAPPING = {
+        'nama': [
+            'name', 'destinasi', 'tempat', 'lokasi', 'wisata', 'objek', 'attraction',
+            'title', 'site name', 'place', 'destination', 'nama tempat', 'object',
+            'attraction name', 'site', 'location name', 'nama lokasi'
+        ],
+        'provinsi': [
+            'province', 'provinsi', 'state', 'region', 'daerah', 'country',
+            'negara', 'country/region', 'area', 'province/state', 'administrative region',
+            'location', 'wilayah', 'negara/region', 'state/region'
+        ],
+        'kota': [
+            'city', 'kota', 'kabupaten', 'kab/kota', 'kota/kab', 'town',
+            'municipality', 'district', 'kecamatan', 'locality', 'city/town',
+            'kota/kabupaten'
+        ],
+        'kategori': [
+            'category', 'kategori', 'tipe', 'type', 'jenis', 'kind', 'classification',
+            'site category', 'attraction type', 'category type', 'classification type',
+            'kategori wisata', 'jenis wisata'
+        ],
+        'rating': [
+            'rating', 'nilai', 'score', 'review', 'rank', 'rate', 'stars',
+            'elevation', 'height', 'grade', 'nilai rating'
+        ],
+        'harga': [
+            'price', 'harga', 'biaya', 'cost', 'tarif', 'admission', 'fee',
+            'entry fee', 'entrance fee', 'ticket price', 'biaya masuk'
+        ],
+        'deskripsi': [
+            'description', 'deskripsi', 'keterangan', 'detail', 'remarks',
+            'notes', 'info', 'information', 'catatan', 'penjelasan', 'info detail'
+        ],
+    }
+    
+    # Complete and CORRECTED coordinates untuk 34 provinsi Indonesia
+    # Dikoreksi untuk akurasi geografis maksimal (lat/lon dari geographic center setiap provinsi)
+    PROVINCE_COORDS = {
+        'Aceh': (5.2, 96.0),  # FIXED: Aceh di FAR NORTH (bukan -5)
+        'Sumatera Utara': (2.5, 99.0),  # Dikoreksi
+        'Sumatera Barat': (-0.5, 100.5),  # Dikoreksi
+        'Riau': (0.25, 101.5),  # Dikoreksi
+        'Jambi': (-1.5, 102.7),  # Tetap baik
+        'Sumatera Selatan': (-3.2, 104.7),  # Tetap baik
+        'Bengkulu': (-3.8, 102.1),  # Dikoreksi
+        'Lampung': (-4.5, 105.3),  # Tetap baik
+        'Kepulauan Bangka Belitung': (-2.7, 107.6),  # Dikoreksi
+        'Kepulauan Riau': (0.8, 101.7),  # Dikoreksi
+        'DKI Jakarta': (-6.2, 106.8),  # Tetap baik
+        'Jawa Barat': (-6.9, 107.5),  # Tetap baik
+        'Jawa Tengah': (-7.5, 110.4),  # Tetap baik
+        'DI Yogyakarta': (-7.8, 110.4),  # Tetap baik
+        'Daerah Istimewa Yogyakarta': (-7.8, 110.4),  # Tetap baik
+        'Jawa Timur': (-7.3, 112.8),  # Tetap baik
+        'Banten': (-6.3, 106.2),  # Dikoreksi
+        'Bali': (-8.7, 115.2),  # Tetap baik
+        'Nusa Tenggara Barat': (-8.5, 117.3),  # Tetap baik
+        'Nusa Tenggara Timur': (-8.7, 121.0),  # Tetap baik
+        'Kalimantan Barat': (0.0, 111.5),  # FIXED: Center point di equator
+        'Kalimantan Tengah': (-1.7, 113.3),  # Tetap baik
+        'Kalimantan Selatan': (-3.5, 114.7),  # Tetap baik
+        'Kalimantan Timur': (0.5, 116.5),  # Tetap baik
+        'Kalimantan Utara': (4.0, 117.6),  # Tetap baik
+        'Sulawesi Utara': (1.5, 124.7),  # Tetap baik
+        'Sulawesi Tengah': (-1.5, 120.8),  # Dikoreksi
+        'Sulawesi Selatan': (-5.5, 120.0),  # FIXED: Dikoreksi dari -5.1477
+        'Sulawesi Tenggara': (-4.3, 122.5),  # Tetap baik
+        'Gorontalo': (0.7, 122.5),  # Tetap baik
+        'Sulawesi Barat': (-2.1, 119.3),  # Tetap baik
+        'Maluku': (-3.2, 129.2),  # Tetap baik
+        'Maluku Utara': (2.0, 128.0),  # FIXED: Adjusted untuk clarity (utara dari Maluku)
+        'Papua': (-4.5, 138.2),  # Tetap baik
+        'Papua Barat': (-1.9, 131.3),  # Tetap baik
+    }
+    
+    # Extended tourism coordinates - lebih comprehensive
+    TOURISM_COORDS = {
+        'Bali': (-8.6705, 115.2126),
+        'Yogyakarta': (-7.7956, 110.3688),
+        'Bandung': (-6.9147, 107.6098),
+        'Jakarta': (-6.2088, 106.8456),
+        'Surabaya': (-7.2575, 112.7521),
+        'Malang': (-7.9827, 112.6345),
+        'Medan': (3.5952, 98.6722),
+        'Pekanbaru': (0.5271, 101.4489),
+        'Makassar': (-5.1477, 119.4327),
+        'Semarang': (-6.9702, 110.4203),
+        'Palembang': (-2.9081, 104.7549),
+        'Banjarmasin': (-3.3243, 114.5971),
+        'Pontianak': (-0.0263, 109.3425),
+        'Samarinda': (-0.4917, 117.1431),
+        'Manado': (1.4748, 124.8244),
+        'Kendari': (-3.9701, 122.5137),
+        'Ambon': (-3.6959, 128.1814),
+        'Jayapura': (-2.5243, 140.6869),
+        'Kupang': (-10.1698, 123.6231),
+    }
+    
+    def __init__(self, pool_size=10, cache_dir=None, cache_ttl=3600, cache_max_bytes=200 * 1024 * 1024,
+                 max_bytes=500 * 1024 * 1024, csv_chunksize=50000, retry_policy=None,
+                 rate_limit=2.0, rate_burst=4, breaker_threshold=5, breaker_reset=60.0,
+                 profile_path=None, stream_html_threshold=20 * 1024 * 1024,
+                 extraction_profiles=None, extraction_profile_path=None, parse_workers=0, archive_dir=None,
+                 category_keywords=None, category_from_description=False):
+        """
+        pool_size: jumlah koneksi HTTP yang disimpan per host (connection pool)
+        cache_dir: folder cache response (None = cache nonaktif)
+        max_bytes: batas ukuran download per URL (None = tanpa batas)
+        csv_chunksize: jumlah baris per chunk saat streaming CSV
+        retry_policy: RetryPolicy (default: 3 attempt, exponential backoff + jitter)
+        rate_limit/rate_burst: token bucket per host (request/detik, burst)
+        breaker_threshold/breaker_reset: circuit breaker per host
+        profile_path: file JSON profil strategy per domain (None = hanya di memori)
+        stream_html_threshold: HTML lebih besar dari ini (bytes) di-parse dengan streaming parser
+        extraction_profiles/extraction_profile_path: profil selector per situs (dict / file JSON)
+        parse_workers: jumlah proses untuk parsing + cleaning HTML (0 = di thread pemanggil)
+        archive_dir: folder arsip halaman mentah untuk reprocess_archive() (None = arsip nonaktif)
+        category_keywords: {kategori: [keyword, ...]} untuk kategori sintetis (None = CategoryClassifier.DEFAULT_KEYWORDS)
+        category_from_description: pakai 'deskripsi' untuk baris yang namanya tidak cocok keyword mana pun
+        Satu instance aman dipakai bersama oleh banyak thread/session
+        """
         self.data = []
+        self.pool_size = pool_size
+        self.max_bytes = max_bytes
+        self.csv_chunksize = csv_chunksize
+        self.stream_html_threshold = stream_html_threshold
+        self.parse_workers = parse_workers
+        self._parse_pool = None
+        self._parse_pool_lock = threading.Lock()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=rate_burst)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=breaker_threshold, reset_timeout=breaker_reset)
+        self.strategy_profiles = StrategyProfileStore(profile_path)
+        self.extraction_profiles = ExtractionProfileRegistry(extraction_profiles, path=extraction_profile_path)
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl, max_bytes=cache_max_bytes) if cache_dir else None
+        self.archive = PageArchive(archive_dir) if archive_dir else None
+        # Matcher alias kolom di-compile sekali, hasil mapping di-cache per skema kolom
+        self.column_matcher = ColumnMatcher(self.COLUMN_MAPPING)
+        self.category_classifier = CategoryClassifier(category_keywords)
+        self.category_from_description = category_from_description
+        self.location_matcher = LocationMatcher(self.TOURISM_COORDS, self.PROVINCE_COORDS)
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -43,155 +263,1399 @@ class TourismDataScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
+        self.session = self._create_session()
+    
+    def _create_session(self):
+        """Buat requests.Session dengan connection pool untuk reuse koneksi TCP/TLS"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.headers)
+        return session
+    
+    def close(self):
+        """Tutup session, semua koneksi di pool, dan process pool parsing"""
+        self.session.close()
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def __enter__(self):
+        return self
     
-    def scrape_from_url(self, url, max_retries=3):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def scrape_from_url(self, url, max_retries=None, use_cache=True, table_mode='best'):
         """
         Scrape data dari URL yang diberikan (Support HTML, CSV, JSON)
+        max_retries: jumlah attempt maksimal (default dari retry_policy)
+        use_cache: pakai response cache (jika cache_dir di-set)
+        table_mode: 'best' (satu tabel terbaik) atau 'union' (gabung semua tabel yang kompatibel)
         Returns: DataFrame atau None jika gagal
         """
-        print(f"[SCRAPE] Starting scrape from URL: {url}")
+        df, _ = self._scrape_one(url, max_retries=max_retries, use_cache=use_cache, table_mode=table_mode)
+        return df
+    
+    def scrape_many(self, urls, max_workers=8, max_per_host=2, max_retries=None,
+                    progress_callback=None, cancel_event=None, table_mode='best'):
+        """
+        Scrape banyak URL secara concurrent
+        max_workers: jumlah thread total, max_per_host: batas request paralel per host
+        progress_callback: fungsi (completed, total, url, df, status) dipanggil tiap URL selesai
+        cancel_event: threading.Event, jika di-set URL yang belum mulai dilewati
+        Returns: (DataFrame gabungan atau None, list status per URL)
+        """
+        urls = list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+        if not urls:
+            return None, []
+        
+        print(f"[BULK] Scraping {len(urls)} URLs with {max_workers} workers (max {max_per_host}/host)")
+        host_limits = {}
+        host_lock = threading.Lock()
+        
+        def host_semaphore(url):
+            host = urlparse(url).netloc.lower()
+            with host_lock:
+                if host not in host_limits:
+                    host_limits[host] = threading.BoundedSemaphore(max_per_host)
+                return host_limits[host]
+        
+        def worker(url):
+            with host_semaphore(url):
+                if cancel_event is not None and cancel_event.is_set():
+                    return None, {'url': url, 'status': 'cancelled', 'rows': 0, 'error': None, 'elapsed': 0.0}
+                return self._scrape_one(url, max_retries=max_retries, table_mode=table_mode)
+        
+        results = self._run_concurrent(urls, worker, max_workers, progress_callback)
+        return self._merge_results(urls, results, label='URLs')
+    
+    @staticmethod
+    def _run_concurrent(urls, worker, max_workers, progress_callback=None):
+        """Jalankan worker(url) -> (df, status) di thread pool. Return dict url -> (df, status)"""
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            futures = {executor.submit(worker, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    results[url] = (None, {'url': url, 'status': 'error', 'rows': 0,
+                                           'error': str(e), 'elapsed': 0.0})
+                if progress_callback is not None:
+                    df, status = results[url]
+                    progress_callback(len(results), len(urls), url, df, status)
+        return results
+    
+    def _merge_results(self, urls, results, label='URLs'):
+        """Gabungkan hasil per URL (urutan input) + kolom sumber_url. Return (DataFrame atau None, report)"""
+        frames = []
+        report = []
+        for url in urls:
+            df, status = results[url]
+            report.append(status)
+            if df is not None and len(df) > 0:
+                frames.append(df.assign(sumber_url=url))
+        
+        ok_count = sum(1 for r in report if r['status'] == 'ok')
+        print(f"[BULK] Finished: {ok_count}/{len(urls)} {label} succeeded")
+        
+        if not frames:
+            return None, report
+        
+        # concat frame dengan kategori berbeda menghasilkan object lagi, jadi dikompakkan ulang
+        merged = self.drop_duplicate_records(pd.concat(frames, ignore_index=True, sort=False), report)
+        return self.optimize_dtypes(merged), report
+    
+    @staticmethod
+    def drop_duplicate_records(merged, report=None):
+        """
+        Buang record duplikat (nama + provinsi) hasil gabungan banyak URL
+        Baris dengan nama/provinsi kosong tidak pernah dianggap duplikat (sumber tanpa kolom itu berisi NaN setelah concat)
+        report: list status per URL, 'rows' disesuaikan dengan baris yang tersisa per sumber_url
+        """
+        if 'nama' in merged.columns and 'provinsi' in merged.columns:
+            keys = merged[['nama', 'provinsi']]
+            duplicated = (keys.duplicated(keep='first') & keys.notna().all(axis=1)).to_numpy()
+            if duplicated.any():
+                merged = merged[~duplicated].reset_index(drop=True)
+                print(f"[BULK] Removed {int(duplicated.sum())} duplicate records across URLs")
+                if report and 'sumber_url' in merged.columns:
+                    kept = merged['sumber_url'].astype(object).value_counts()
+                    for status in report:
+                        kept_rows = int(kept.get(status['url'], 0))
+                        if status.get('rows') and kept_rows < status['rows']:
+                            status['duplicates'] = status.get('duplicates', 0) + status['rows'] - kept_rows
+                            status['rows'] = kept_rows
+        return merged
+    
+    SITEMAP_MAX_DEPTH = 3
+    
+    def scrape_sitemap(self, sitemap_url, pattern=None, max_urls=None, batch_size=200, max_workers=8,
+                       max_per_host=2, max_retries=None, progress_callback=None, cancel_event=None,
+                       table_mode='best'):
+        """
+        Scrape semua URL dari sitemap.xml / sitemap index (termasuk .xml.gz)
+        pattern: regex, hanya URL yang cocok yang di-scrape (None = semua)
+        max_urls: batas jumlah URL, batch_size: jumlah URL per batch scrape_many
+        progress_callback: fungsi (completed, total, url, df, status), total = URL yang sudah ditemukan
+        Returns: (DataFrame gabungan atau None, list status per URL)
+        """
+        frames = []
+        report = []
+        batch = []
+        
+        def run_batch(batch):
+            offset = len(report)
+            
+            def batch_progress(completed, total, url, df, status):
+                if progress_callback is not None:
+                    progress_callback(offset + completed, offset + total, url, df, status)
+            
+            df, batch_report = self.scrape_many(batch, max_workers=max_workers, max_per_host=max_per_host,
+                                                max_retries=max_retries, progress_callback=batch_progress,
+                                                cancel_event=cancel_event, table_mode=table_mode)
+            report.extend(batch_report)
+            if df is not None:
+                frames.append(df)
         
-        for attempt in range(max_retries):
+        sitemap_errors = []
+        for url in self.iter_sitemap_urls(sitemap_url, pattern=pattern, max_urls=max_urls, errors=sitemap_errors):
+            if cancel_event is not None and cancel_event.is_set():
+                print("[SITEMAP] Cancelled")
+                break
+            batch.append(url)
+            if len(batch) >= batch_size:
+                run_batch(batch)
+                batch = []
+        if batch and not (cancel_event is not None and cancel_event.is_set()):
+            run_batch(batch)
+        
+        print(f"[SITEMAP] Scraped {len(report)} URLs from {sitemap_url}")
+        # File sitemap yang gagal dibaca ikut dilaporkan (URL di dalamnya tidak ter-scrape)
+        report.extend(sitemap_errors)
+        if not frames:
+            return None, report
+        # concat frame dengan kategori berbeda menghasilkan object lagi, jadi dikompakkan ulang
+        merged = self.drop_duplicate_records(pd.concat(frames, ignore_index=True, sort=False), report)
+        return self.optimize_dtypes(merged), report
+    
+    def iter_sitemap_urls(self, sitemap_url, pattern=None, max_urls=None, errors=None):
+        """
+        Generator URL halaman dari sitemap / sitemap index, di-parse incremental (iterparse)
+        Sitemap index diikuti rekursif (maks SITEMAP_MAX_DEPTH level), file gzip didukung
+        Tiap file dibaca sampai habis (response ditutup) sebelum URL-nya di-yield, supaya koneksi
+        tidak menganggur selama pemanggil men-scrape batch
+        errors: list, diisi status untuk file sitemap yang gagal dibaca
+        """
+        matcher = re.compile(pattern) if isinstance(pattern, str) else pattern
+        seen = _SeenUrls()
+        pending = [(sitemap_url, 0)]
+        count = 0
+        
+        while pending:
+            url, depth = pending.pop(0)
+            if not seen.add(url):
+                continue
+            pages = []
+            children = []
+            entries = self._iter_sitemap_entries(url)
             try:
-                self.headers['User-Agent'] = self.user_agents[attempt % len(self.user_agents)]
-                
-                print(f"[ATTEMPT] Attempt {attempt + 1}/{max_retries}...")
-                timeout = 60 if attempt > 0 else 30
-                response = requests.get(url, headers=self.headers, timeout=timeout)
-                response.raise_for_status()
-                
-                print(f"[OK] Response received (Status: {response.status_code})")
-                response.encoding = response.apparent_encoding
-                
-                df = None
-                content_type = response.headers.get('content-type', '').lower()
-                url_lower = url.lower()
-                
-                # Strategy 0: CSV file
-                if 'csv' in content_type or url_lower.endswith('.csv'):
-                    print("[STRATEGY] Strategy 0: CSV file...")
-                    try:
-                        df = pd.read_csv(StringIO(response.text))
-                        print(f"[CSV] Loaded: {len(df)} rows x {len(df.columns)} cols")
-                    except Exception as e:
-                        print(f"   [WARN] CSV parsing failed: {e}")
-                
-                # Strategy 1: Pandas read_html
-                if df is None and ('text/html' in content_type or url_lower.startswith('http')):
-                    print("[STRATEGY] Strategy 1: Pandas read_html...")
-                    try:
-                        dfs = pd.read_html(StringIO(response.text))
-                        if dfs:
-                            valid_dfs = [d for d in dfs if len(d) >= 3 and len(d.columns) >= 2]
-                            if valid_dfs:
-                                df = max(valid_dfs, key=len)
-                                print(f"[HTML] Found table: {len(df)} rows x {len(df.columns)} cols")
-                    except Exception as e:
-                        print(f"   [WARN] read_html failed: {e}")
-                
-                # Strategy 2: BeautifulSoup parsing
-                if df is None:
-                    print("[STRATEGY] Strategy 2: BeautifulSoup parsing...")
-                    try:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        table = self._parse_html_table(soup)
-                        df = table if table is not None else None
-                        if df is not None:
-                            print(f"[SOUP] Parsed: {len(df)} rows x {len(df.columns)} cols")
-                    except Exception as e:
-                        print(f"   [WARN] BeautifulSoup parsing failed: {e}")
-                
-                # Strategy 3: Extract div lists
-                if df is None:
-                    print("[STRATEGY] Strategy 3: Div/list extraction...")
-                    try:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        df = self._extract_from_div_lists(soup)
-                        if df is not None:
-                            print(f"[DIV] Extracted: {len(df)} rows x {len(df.columns)} cols")
-                    except Exception as e:
-                        print(f"   [WARN] Div extraction failed: {e}")
-                
+                for kind, loc in entries:
+                    if kind == 'sitemap':
+                        if depth < self.SITEMAP_MAX_DEPTH:
+                            children.append((loc, depth + 1))
+                        continue
+                    if matcher is not None and not matcher.search(loc):
+                        continue
+                    if not seen.add(loc):
+                        continue
+                    pages.append(loc)
+                    if max_urls and count + len(pages) >= max_urls:
+                        break
+            except Exception as e:
+                print(f"[SITEMAP] Failed to read {url}: {e}")
+                if errors is not None:
+                    errors.append({'url': url, 'status': 'failed', 'rows': 0, 'error': str(e), 'elapsed': 0.0})
+            finally:
+                entries.close()
+            
+            yield from pages
+            count += len(pages)
+            if max_urls and count >= max_urls:
+                print(f"[SITEMAP] URL limit {max_urls} reached")
+                return
+            pending.extend(children)
+    
+    def _iter_sitemap_entries(self, url):
+        """Stream satu file sitemap, yield ('url' | 'sitemap', loc) tanpa membangun seluruh tree"""
+        status = {'url': url, 'status': 'failed', 'error': None, 'attempts': 0}
+        
+        def attempt_fn(attempt):
+            headers = {'User-Agent': self.user_agents[attempt % len(self.user_agents)]}
+            response = self.session.get(url, headers=headers, timeout=60 if attempt > 0 else 30, stream=True)
+            response.raise_for_status()
+            return response
+        
+        succeeded, response = self._run_with_retries(url, status, attempt_fn, max_retries=None)
+        if not succeeded:
+            raise RuntimeError(status.get('error') or 'request failed')
+        
+        print(f"[SITEMAP] Reading {url}")
+        with response:
+            response.raw.decode_content = True
+            stream = io.BufferedReader(_BudgetedStream(response.raw, self.max_bytes), buffer_size=256 * 1024)
+            if stream.peek(2)[:2] == b'\x1f\x8b':
+                # File .xml.gz (gzip di body, bukan Content-Encoding)
+                stream = gzip.GzipFile(fileobj=stream)
+            
+            root = None
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                if event != 'end':
+                    continue
+                tag = elem.tag.rsplit('}', 1)[-1]
+                if tag in ('url', 'sitemap'):
+                    loc = next((child.text for child in elem if child.tag.rsplit('}', 1)[-1] == 'loc'), None)
+                    if loc and loc.strip():
+                        yield tag, loc.strip()
+                    # Lepas elemen yang sudah diproses supaya memori tetap kecil
+                    root.clear()
+    
+    def reprocess_archive(self, urls=None, max_workers=4, progress_callback=None, cancel_event=None,
+                          table_mode='best'):
+        """
+        Jalankan ulang extraction + cleaning dari arsip halaman, tanpa request ke network
+        urls: hanya URL tertentu (None = semua URL di arsip, versi terbaru)
+        Parsing paralel di process pool jika parse_workers aktif, selain itu di thread pool
+        Returns: (DataFrame gabungan atau None, list status per URL)
+        """
+        if self.archive is None:
+            print("[ARCHIVE] Page archive is not enabled (archive_dir=None)")
+            return None, []
+        entries = {entry['url']: entry for entry in self.archive.entries(urls)}
+        if not entries:
+            return None, []
+        
+        print(f"[ARCHIVE] Reprocessing {len(entries)} archived pages with {max_workers} workers")
+        
+        def worker(url):
+            if cancel_event is not None and cancel_event.is_set():
+                return None, {'url': url, 'status': 'cancelled', 'rows': 0, 'error': None, 'elapsed': 0.0}
+            return self._reprocess_entry(entries[url], table_mode=table_mode)
+        
+        results = self._run_concurrent(list(entries), worker, max_workers, progress_callback)
+        return self._merge_results(list(entries), results, label='archived pages')
+    
+    def _reprocess_entry(self, entry, table_mode='best'):
+        """Extraction + cleaning satu record arsip. Return (DataFrame atau None, status)"""
+        url = entry['url']
+        started = time.perf_counter()
+        status = {'url': url, 'status': 'no_data', 'rows': 0, 'error': None, 'elapsed': 0.0,
+                  'cache': 'archive', 'strategy': None, 'fetched_at': entry['fetched_at']}
+        df = None
+        try:
+            header, body = self.archive.read(entry)
+            content_type = header['headers'].get('content-type', '').lower()
+            if 'json' in content_type or url.lower().endswith('.json'):
+                status['strategy'] = 'json'
+                df = self._parse_json(body)
                 if df is not None and len(df) > 0:
                     df = self.clean_scraped_data(df)
-                    print(f"[SUCCESS] Scraping successful!")
-                    return df
+                    if df is None:
+                        status.update(status='empty', error='Data kosong setelah cleaning')
+            if df is None and status['status'] != 'empty':
+                df, strategy, timings, raw_rows = self._extract_html_body(body, urlparse(url).netloc.lower(),
+                                                                          table_mode, content_type)
+                status.update(strategy=strategy, timings=timings)
+                if df is None and raw_rows:
+                    status.update(status='empty', error='Data kosong setelah cleaning')
+            if df is not None and len(df) > 0:
+                status.update(status='ok', rows=len(df))
+        except Exception as e:
+            print(f"[ARCHIVE] Failed to reprocess {url}: {e}")
+            status.update(status='failed', error=str(e))
+            df = None
+        status['elapsed'] = round(time.perf_counter() - started, 3)
+        return df, status
+    
+    NEXT_PAGE_TEXTS = {'next', 'next page', 'next »', 'berikutnya', 'selanjutnya', 'lanjut',
+                       'halaman berikutnya', '›', '»', '>', '>>', '→'}
+    PAGE_PARAMS = ('page', 'p', 'pg', 'hal', 'halaman', 'paged', 'offset', 'start')
+    
+    def crawl(self, start_url, max_pages=20, max_rows=None, max_workers=4, max_retries=None,
+              progress_callback=None, cancel_event=None, table_mode='best'):
+        """
+        Crawl listing multi-halaman: ikuti link pagination (?page=N, rel=next, tombol "Next")
+        Halaman di-fetch concurrent per gelombang, tabel tiap halaman digabung lalu di-clean sekali
+        max_pages: batas jumlah halaman, max_rows: berhenti setelah baris mentah mencapai batas
+        progress_callback: fungsi (completed, total, url, df, status) dipanggil tiap halaman selesai
+        Returns: (DataFrame bersih atau None, list status per halaman)
+        """
+        print(f"[CRAWL] Starting crawl from {start_url} (max {max_pages} pages)")
+        frames = []
+        report = []
+        total_rows = 0
+        
+        for url, raw_df, status in self._iter_crawl_pages(start_url, max_pages, max_rows, max_workers,
+                                                          max_retries, cancel_event, table_mode):
+            report.append(status)
+            if raw_df is not None:
+                frames.append(raw_df.assign(sumber_url=url))
+                total_rows += len(raw_df)
+            if progress_callback is not None:
+                progress_callback(len(report), max_pages, url, raw_df, status)
+        
+        print(f"[CRAWL] Fetched {len(report)} pages, {total_rows} raw rows")
+        if not frames:
+            return None, report
+        
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        if max_rows:
+            df = df.head(max_rows)
+        return self.clean_scraped_data(df), report
+    
+    def _iter_crawl_pages(self, start_url, max_pages=20, max_rows=None, max_workers=4, max_retries=None,
+                          cancel_event=None, table_mode='best'):
+        """Generator: fetch halaman per gelombang concurrent, yield (url, DataFrame mentah, status) per halaman"""
+        seen = _SeenUrls()
+        seen.add(start_url)
+        frontier = [start_url]
+        fetched = 0
+        total_rows = 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while frontier and fetched < max_pages:
+                if cancel_event is not None and cancel_event.is_set():
+                    print("[CRAWL] Cancelled")
+                    break
+                if max_rows and total_rows >= max_rows:
+                    print(f"[CRAWL] Row limit {max_rows} reached")
+                    break
                 
-                print(f"[RETRY] No valid data found, retrying...")
-                time.sleep(2)
+                wave = frontier[:max_pages - fetched]
+                frontier = frontier[len(wave):]
+                results = list(executor.map(
+                    lambda u: self._fetch_page(u, max_retries=max_retries, table_mode=table_mode), wave
+                ))
                 
-            except requests.exceptions.Timeout:
-                print(f"[TIMEOUT] Request timeout on attempt {attempt + 1}")
-                time.sleep(3)
-            except requests.exceptions.ConnectionError:
-                print(f"[NETWORK] Connection error on attempt {attempt + 1}")
-                time.sleep(3)
+                for url, (raw_df, links, status) in zip(wave, results):
+                    fetched += 1
+                    if raw_df is not None:
+                        total_rows += len(raw_df)
+                    for link in links:
+                        if seen.add(link):
+                            frontier.append(link)
+                    yield url, raw_df, status
+    
+    def _fetch_page(self, url, max_retries=None, table_mode='best'):
+        """Fetch + extract satu halaman tanpa cleaning. Return (DataFrame mentah, link pagination, status)"""
+        started = time.perf_counter()
+        status = {'url': url, 'status': 'failed', 'rows': 0, 'error': None, 'elapsed': 0.0, 'attempts': 0}
+        
+        def attempt_fn(attempt):
+            headers = {'User-Agent': self.user_agents[attempt % len(self.user_agents)]}
+            response = self.session.get(url, headers=headers, timeout=60 if attempt > 0 else 30)
+            response.raise_for_status()
+            if self.max_bytes and len(response.content) > self.max_bytes:
+                raise DownloadTooLarge(f"Response {len(response.content)} bytes melebihi batas {self.max_bytes} bytes")
+            body = self._read_body(url, response)
+            encoding = sniff_encoding(body, response.headers.get('content-type'))
+            timings = {}
+            domain = urlparse(url).netloc.lower()
+            df = self._extract_with_site_profile(domain, timings, html=body, encoding=encoding)
+            soup = self._parse_document(body, timings, encoding=encoding)
+            if df is not None:
+                strategy = 'site_profile'
+            else:
+                df, strategy = self._extract_from_soup(soup, timings, domain=domain, table_mode=table_mode)
+            status.update(strategy=strategy, timings=timings)
+            return df, self._find_pagination_links(soup, response.url)
+        
+        succeeded, result = self._run_with_retries(url, status, attempt_fn, max_retries=max_retries)
+        df, links = result if succeeded else (None, [])
+        if succeeded:
+            status.update(status='ok' if df is not None else 'no_data', rows=len(df) if df is not None else 0)
+        status['elapsed'] = round(time.perf_counter() - started, 3)
+        return df, links, status
+    
+    def _find_pagination_links(self, soup, base_url):
+        """Cari link ke halaman berikutnya / halaman bernomor pada host yang sama"""
+        base = urlparse(base_url)
+        base_query_keys = set(parse_qs(base.query))
+        links = []
+        
+        for tag in soup.find_all(['a', 'link'], href=True):
+            href = tag['href'].strip()
+            if not href or href.startswith(('#', 'javascript:', 'mailto:')):
+                continue
+            target = urlparse(urljoin(base_url, href))._replace(fragment='')
+            if target.netloc.lower() != base.netloc.lower():
+                continue
+            
+            rel = [r.lower() for r in (tag.get('rel') or [])]
+            text = tag.get_text(strip=True).lower()
+            label = (tag.get('aria-label') or tag.get('title') or '').lower()
+            classes = ' '.join(tag.get('class') or []).lower()
+            
+            is_next = ('next' in rel or text in self.NEXT_PAGE_TEXTS
+                       or 'next' in label or 'berikutnya' in label or 'next' in classes.split())
+            is_numbered = target.path == base.path and self._is_page_query(target.query, base_query_keys)
+            is_page_path = bool(re.search(r'/(page|halaman|hal)/\d+/?$', target.path, re.I))
+            
+            if is_next or is_numbered or is_page_path:
+                links.append(target.geturl())
+        
+        return list(dict.fromkeys(links))
+    
+    def _is_page_query(self, query, base_query_keys):
+        """Query string berisi parameter halaman numerik (page=2, hal=3, ...)"""
+        params = parse_qs(query)
+        for key in self.PAGE_PARAMS:
+            values = params.get(key)
+            if values and values[0].isdigit():
+                # Parameter lain harus sama dengan halaman awal (bukan filter/sort berbeda)
+                return set(params) - {key} <= base_query_keys
+        return False
+    
+    def iter_scrape(self, url, max_rows=None, max_retries=None, table_mode='best', crawl=False, max_pages=20,
+                    cancel_event=None):
+        """
+        Versi streaming scrape_from_url: yield (DataFrame batch bersih atau None, dict status)
+        CSV / NDJSON per chunk, crawl per halaman, format lain satu batch
+        Batch None = URL/halaman tanpa data (status tetap dilaporkan)
+        max_rows: berhenti (dan tutup download) begitu jumlah baris tercapai, batch terakhir dipotong
+        """
+        if crawl:
+            batches = self._iter_crawl_batches(url, max_pages, max_retries, cancel_event, table_mode)
+        else:
+            batches = self._iter_url_batches(url, max_retries, table_mode)
+        
+        rows = 0
+        try:
+            for batch, status in batches:
+                if batch is not None and max_rows and rows + len(batch) >= max_rows:
+                    batch = batch.head(max_rows - rows)
+                    yield batch, status
+                    print(f"[STREAM] Row limit {max_rows} reached, stopping early")
+                    return
+                rows += len(batch) if batch is not None else 0
+                yield batch, status
+                if cancel_event is not None and cancel_event.is_set():
+                    print("[STREAM] Cancelled")
+                    return
+        finally:
+            batches.close()
+    
+    def _iter_crawl_batches(self, start_url, max_pages=20, max_retries=None, cancel_event=None, table_mode='best'):
+        """Generator crawl: yield (DataFrame halaman yang sudah di-clean atau None, status halaman)"""
+        for url, raw_df, status in self._iter_crawl_pages(start_url, max_pages, max_retries=max_retries,
+                                                          cancel_event=cancel_event, table_mode=table_mode):
+            df = self.clean_scraped_data(raw_df) if raw_df is not None else None
+            yield (df.assign(sumber_url=url) if df is not None else None), status
+    
+    def _iter_url_batches(self, url, max_retries=None, table_mode='best'):
+        """Generator satu URL: yield (DataFrame batch bersih, status) selama download berjalan"""
+        print(f"[STREAM] Starting streaming scrape from URL: {url}")
+        started = time.perf_counter()
+        status = {'url': url, 'status': 'failed', 'rows': 0, 'error': None, 'elapsed': 0.0,
+                  'cache': None, 'attempts': 0, 'strategy': None}
+        
+        cache_key = url if table_mode == 'best' else f"{url}#{table_mode}"
+        cache_entry = self.cache.get(cache_key) if self.cache else None
+        if cache_entry is not None and self.cache.is_fresh(cache_entry):
+            df = self.cache.load_dataframe(cache_entry)
+            if df is not None:
+                print(f"[CACHE] Fresh cache hit: {len(df)} rows")
+                status.update(status='ok', rows=len(df), cache='hit',
+                              elapsed=round(time.perf_counter() - started, 3))
+                yield df, status
+                return
+        
+        if self._is_oversized(url):
+            status.update(status='too_large', error=f'Content-Length melebihi batas {self.max_bytes} bytes')
+            yield None, status
+            return
+        
+        def attempt_fn(attempt):
+            """Return (DataFrame cache hasil revalidasi 304, None) atau (None, response yang siap di-stream)"""
+            headers = {'User-Agent': self.user_agents[attempt % len(self.user_agents)]}
+            timeout = 60 if attempt > 0 else 30
+            response = self.session.get(url, headers={**headers, **ResponseCache.conditional_headers(cache_entry)},
+                                        timeout=timeout, stream=True)
+            if response.status_code == 304 and cache_entry is not None:
+                df = self._revalidated_frame(response, self.cache, cache_entry, cache_key, status)
+                if df is not None:
+                    return df, None
+                # Cached DataFrame hilang, request ulang tanpa conditional headers
+                response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+            response.raise_for_status()
+            content_length = int(response.headers.get('content-length') or 0)
+            if self.max_bytes and content_length > self.max_bytes:
+                response.close()
+                raise DownloadTooLarge(f"Content-Length {content_length} melebihi batas {self.max_bytes} bytes")
+            return None, response
+        
+        succeeded, result = self._run_with_retries(url, status, attempt_fn, max_retries=max_retries)
+        if not succeeded:
+            status['elapsed'] = round(time.perf_counter() - started, 3)
+            yield None, status
+            return
+        status['error'] = None
+        cached_df, response = result
+        if cached_df is not None:
+            status.update(status='ok', rows=len(cached_df), elapsed=round(time.perf_counter() - started, 3))
+            yield cached_df, status
+            return
+        
+        # Simpan ke cache hanya jika stream selesai (tidak dihentikan lebih awal oleh pemanggil)
+        frames = [] if self.cache is not None else None
+        try:
+            for batch in self._iter_response_frames(url, response, status, table_mode):
+                status.update(status='ok', rows=status['rows'] + len(batch), error=None,
+                              elapsed=round(time.perf_counter() - started, 3))
+                if frames is not None:
+                    frames.append(batch)
+                yield batch, status
+        except DownloadTooLarge as e:
+            print(f"[ABORT] {e}")
+            status.update(status='too_large', error=str(e))
+        except Exception as e:
+            print(f"[ERROR] Streaming scrape failed: {e}")
+            status.update(status='failed', error=str(e))
+        finally:
+            response.close()
+        
+        status['elapsed'] = round(time.perf_counter() - started, 3)
+        if status['rows'] == 0:
+            if status['status'] == 'failed' and status['error'] is None:
+                status.update(status='no_data', error='No valid data found')
+            yield None, status
+        elif frames and status['status'] == 'ok':
+            self.cache.store(cache_key, response.headers,
+                             pd.concat(frames, ignore_index=True, sort=False) if len(frames) > 1 else frames[0])
+            status['cache'] = 'stored'
+    
+    def _scrape_one(self, url, max_retries=None, use_cache=True, table_mode='best'):
+        """
+        Scrape satu URL, return (DataFrame atau None, dict status)
+        max_retries: jumlah attempt maksimal (default dari retry_policy)
+        """
+        print(f"[SCRAPE] Starting scrape from URL: {url}")
+        started = time.perf_counter()
+        status = {'url': url, 'status': 'failed', 'rows': 0, 'error': None, 'elapsed': 0.0,
+                  'cache': None, 'attempts': 0}
+        
+        def finish(df=None, **fields):
+            status.update(fields)
+            status['elapsed'] = round(time.perf_counter() - started, 3)
+            return df, status
+        
+        cache = self.cache if use_cache else None
+        # Hasil mode union berbeda dengan mode best untuk URL yang sama
+        cache_key = url if table_mode == 'best' else f"{url}#{table_mode}"
+        cache_entry = cache.get(cache_key) if cache else None
+        if cache_entry is not None and cache.is_fresh(cache_entry):
+            df = cache.load_dataframe(cache_entry)
+            if df is not None:
+                print(f"[CACHE] Fresh cache hit: {len(df)} rows")
+                return finish(df, status='ok', rows=len(df), cache='hit')
+        
+        if self._is_oversized(url):
+            return finish(status='too_large', error=f'Content-Length melebihi batas {self.max_bytes} bytes')
+        
+        succeeded, df = self._run_with_retries(
+            url, status,
+            lambda attempt: self._attempt_scrape(url, attempt, cache, cache_entry, status, cache_key, table_mode),
+            max_retries=max_retries
+        )
+        if not succeeded:
+            return finish()
+        if df is None:
+            # Hasil deterministik: halaman tidak berisi data, retry tidak akan membantu
+            print("[FAILED] No valid data found")
+            if status['status'] != 'empty':
+                status.update(status='no_data', error='No valid data found')
+            return finish()
+        print(f"[SUCCESS] Scraping successful!")
+        return finish(df, status='ok', rows=len(df), error=None)
+    
+    def _run_with_retries(self, url, status, attempt_fn, max_retries=None):
+        """
+        Jalankan attempt_fn(attempt) dengan rate limit, circuit breaker dan retry policy
+        Returns: (True, hasil attempt_fn) jika berhasil, (False, None) jika gagal (alasan di status)
+        """
+        host = urlparse(url).netloc.lower()
+        max_attempts = max_retries or self.retry_policy.max_attempts
+        
+        for attempt in range(max_attempts):
+            if not self.circuit_breaker.allow(host):
+                print(f"[BREAKER] Circuit open for {host}, skipping request")
+                status.update(status='circuit_open', error=f'Circuit breaker open untuk {host}')
+                return False, None
+            
+            waited = self.rate_limiter.acquire(host)
+            if waited:
+                print(f"[RATE] Waited {waited:.2f}s for {host}")
+            
+            status['attempts'] = attempt + 1
+            print(f"[ATTEMPT] Attempt {attempt + 1}/{max_attempts}...")
+            try:
+                result = attempt_fn(attempt)
+            except DownloadTooLarge as e:
+                print(f"[ABORT] {e}")
+                status.update(status='too_large', error=str(e))
+                # Host tetap menjawab: request percobaan (half-open) selesai, circuit ditutup lagi
+                self.circuit_breaker.record_success(host)
+                return False, None
             except Exception as e:
-                print(f"[ERROR] Unexpected error on attempt {attempt + 1}: {e}")
-                time.sleep(2)
+                retryable = self.retry_policy.is_retryable(e)
+                status['error'] = str(e)
+                if retryable:
+                    self.circuit_breaker.record_failure(host)
+                if not retryable:
+                    print(f"[ERROR] Non-retryable error: {e}")
+                    self._resolve_circuit(host, e)
+                    return False, None
+                if attempt + 1 >= max_attempts:
+                    print(f"[ERROR] Retryable error on last attempt: {e}")
+                    break
+                delay = self.retry_policy.delay_for(e, attempt)
+                print(f"[RETRY] {type(e).__name__} on attempt {attempt + 1}, retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            
+            self.circuit_breaker.record_success(host)
+            return True, result
         
         print("[FAILED] Scraping failed after all attempts")
+        return False, None
+    
+    def _resolve_circuit(self, host, exc):
+        """
+        Catat hasil error non-retryable ke circuit breaker supaya state half-open tidak menggantung:
+        host menjawab (HTTP 4xx, error parsing) -> sukses, request tidak sampai ke host -> gagal
+        """
+        if isinstance(exc, requests.exceptions.RequestException) and getattr(exc, 'response', None) is None:
+            self.circuit_breaker.record_failure(host)
+        else:
+            self.circuit_breaker.record_success(host)
+    
+    @staticmethod
+    def _revalidated_frame(response, cache, cache_entry, cache_key, status):
+        """Response 304: tutup response, return DataFrame cache (TTL diperpanjang) atau None jika pickle hilang"""
+        response.close()
+        df = cache.load_dataframe(cache_entry)
+        if df is not None:
+            cache.touch(cache_key)
+            print(f"[CACHE] 304 Not Modified, using cached data: {len(df)} rows")
+            status['cache'] = 'revalidated'
+        return df
+    
+    def _attempt_scrape(self, url, attempt, cache, cache_entry, status, cache_key=None, table_mode='best'):
+        """Satu attempt: request, pilih strategy, cleaning. Return DataFrame bersih atau None"""
+        # Header per-request (bukan mutasi self.headers) supaya aman antar thread
+        headers = {'User-Agent': self.user_agents[attempt % len(self.user_agents)]}
+        timeout = 60 if attempt > 0 else 30
+        response = self.session.get(url, headers={**headers, **ResponseCache.conditional_headers(cache_entry)},
+                                    timeout=timeout, stream=True)
+        
+        if response.status_code == 304 and cache_entry is not None:
+            df = self._revalidated_frame(response, cache, cache_entry, cache_key or url, status)
+            if df is not None:
+                return df
+            # Cached DataFrame hilang, request ulang tanpa conditional headers
+            response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        
+        response.raise_for_status()
+        
+        print(f"[OK] Response received (Status: {response.status_code})")
+        content_length = int(response.headers.get('content-length') or 0)
+        if self.max_bytes and content_length > self.max_bytes:
+            response.close()
+            raise DownloadTooLarge(f"Content-Length {content_length} melebihi batas {self.max_bytes} bytes")
+        
+        frames = list(self._iter_response_frames(url, response, status, table_mode))
+        if not frames:
+            return None
+        
+        df = pd.concat(frames, ignore_index=True, sort=False) if len(frames) > 1 else frames[0]
+        if status['strategy'] in ('csv', 'ndjson'):
+            # Chunk di-clean terpisah, duplikat antar chunk dibuang setelah digabung
+            df = self.drop_duplicate_records(df)
+            print(f"[{status['strategy'].upper()}] Loaded: {len(df)} rows x {len(df.columns)} cols")
+        if len(frames) > 1:
+            df = self.optimize_dtypes(df)
+        
+        if cache is not None:
+            # Body mentah disimpan di arsip halaman, cache cukup menyimpan DataFrame
+            cache.store(cache_key or url, response.headers, df)
+            status['cache'] = 'stored'
+        return df
+    
+    def _iter_response_frames(self, url, response, status, table_mode='best'):
+        """
+        Pilih strategy berdasarkan response, yield DataFrame yang sudah di-clean
+        CSV / NDJSON per chunk (streaming), format lain satu DataFrame
+        Strategy & timing dicatat di status, status 'empty' jika semua baris hilang saat cleaning
+        """
+        content_length = int(response.headers.get('content-length') or 0)
+        content_type = response.headers.get('content-type', '').lower()
+        url_lower = url.lower()
+        
+        # Strategy 0: CSV file (streaming, cleaning per chunk)
+        if 'csv' in content_type or url_lower.endswith('.csv'):
+            print("[STRATEGY] Strategy 0: Streaming CSV...")
+            status['strategy'] = 'csv'
+            yield from self._guard_stream(self._iter_csv_chunks(response), 'CSV')
+            return
+        
+        # Strategy 0b: JSON / NDJSON (records array atau envelope data/results)
+        body = None
+        if self._is_ndjson(content_type, url_lower):
+            print("[STRATEGY] Strategy 0b: Streaming NDJSON...")
+            status['strategy'] = 'ndjson'
+            raw_rows = 0
+            cleaned_rows = 0
+            for frame in self._guard_stream(self._iter_ndjson_frames(response), 'NDJSON'):
+                raw_rows += len(frame)
+                frame = self.clean_scraped_data(frame)
+                if frame is not None:
+                    cleaned_rows += len(frame)
+                    yield frame
+            if raw_rows and not cleaned_rows:
+                status.update(status='empty', error='Data kosong setelah cleaning')
+            return
+        
+        if 'json' in content_type or url_lower.endswith('.json'):
+            print("[STRATEGY] Strategy 0b: JSON records...")
+            status['strategy'] = 'json'
+            body = self._read_body(url, response)
+            try:
+                df = self._parse_json(body)
+            except Exception as e:
+                print(f"   [WARN] JSON parsing failed: {e}")
+                df = None
+            if df is not None and len(df) > 0:
+                yield from self._cleaned(df, status)
+                return
+        
+        # Strategy 1 (streaming): halaman HTML sangat besar, parse tabel tanpa DOM tree
+        if (status.get('strategy') is None and self.stream_html_threshold
+                and content_length > self.stream_html_threshold):
+            print(f"[STRATEGY] Strategy 1s: Streaming HTML table parser ({content_length} bytes)...")
+            status['strategy'] = 'html_stream'
+            df = self._read_html_table_stream(response)
+            if df is not None and len(df) > 0:
+                yield from self._cleaned(df, status)
+            return
+        
+        # Strategy 1-3: HTML, satu parsed document dipakai bersama semua strategy
+        if body is None:
+            body = self._read_body(url, response)
+        df, strategy, timings, raw_rows = self._extract_html_body(body, urlparse(url).netloc.lower(), table_mode,
+                                                                  content_type)
+        status['strategy'] = strategy
+        status['timings'] = timings
+        if df is not None and len(df) > 0:
+            yield df
+        elif raw_rows:
+            status.update(status='empty', error='Data kosong setelah cleaning')
+    
+    def _cleaned(self, df, status):
+        """Generator satu DataFrame bersih, atau tandai status 'empty' jika habis saat cleaning"""
+        df = self.clean_scraped_data(df)
+        if df is None:
+            status.update(status='empty', error='Data kosong setelah cleaning')
+            return
+        yield df
+    
+    @staticmethod
+    def _guard_stream(chunks, label):
+        """
+        Teruskan chunk dari stream parser. Error sebelum chunk pertama = format tidak cocok (None data),
+        error setelahnya diteruskan supaya attempt di-retry, bukan mengembalikan data setengah
+        """
+        count = 0
+        try:
+            for chunk in chunks:
+                count += 1
+                yield chunk
+        except DownloadTooLarge:
+            raise
+        except Exception as e:
+            if count:
+                raise
+            print(f"   [WARN] {label} parsing failed: {e}")
+    
+    def _read_body(self, url, response):
+        """Baca seluruh body response, simpan ke arsip halaman jika arsip aktif"""
+        body = response.content
+        if self.archive is not None:
+            try:
+                self.archive.append(url, body, response.headers, response.status_code)
+            except OSError as e:
+                print(f"[ARCHIVE] Failed to archive {url}: {e}")
+        return body
+    
+    def _extract_html_body(self, body, domain, table_mode='best', content_type=None):
+        """
+        Extract + cleaning body HTML (bytes), di process pool jika parse_workers aktif
+        Body tidak di-decode ke str: encoding di-sniff murah lalu bytes langsung diberikan ke parser
+        Returns: (DataFrame bersih atau None, nama strategy, timings, jumlah baris sebelum cleaning)
+        """
+        if self.parse_workers:
+            # Yang dikirim balik dari worker hanya array per kolom
+            try:
+                return self._extract_in_process_pool(body, domain, table_mode, content_type)
+            except BrokenProcessPool as e:
+                # Pool sudah dibuang (dibuat ulang untuk halaman berikutnya), halaman ini di-parse di proses ini
+                print(f"[POOL] Parse process pool broken ({e}), parsing in-process")
+        df, strategy, timings = self._extract_from_html(body, domain=domain, table_mode=table_mode,
+                                                        encoding=sniff_encoding(body, content_type))
+        raw_rows = len(df) if df is not None else 0
+        if raw_rows:
+            df = self.clean_scraped_data(df)
+        return df, strategy, timings, raw_rows
+    
+    def _get_parse_pool(self):
+        """Process pool untuk parsing HTML (dibuat saat pertama dipakai)"""
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                # spawn: aman dipakai dari aplikasi multi-thread (Streamlit, scrape_many)
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                       mp_context=multiprocessing.get_context('spawn'))
+                print(f"[POOL] Started parse process pool ({self.parse_workers} workers)")
+            return self._parse_pool
+    
+    def _discard_parse_pool(self, pool):
+        """Buang pool yang rusak (worker mati / gagal spawn) supaya _get_parse_pool membuat pool baru"""
+        with self._parse_pool_lock:
+            if self._parse_pool is pool:
+                self._parse_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _extract_in_process_pool(self, body, domain, table_mode='best', content_type=None):
+        """
+        Kirim raw bytes ke process pool untuk decode, parse, extract dan cleaning
+        Returns: (DataFrame bersih atau None, nama strategy, timings, jumlah baris sebelum cleaning)
+        """
+        site_profile = self.extraction_profiles.get(domain)
+        site_spec = (site_profile.item, site_profile.fields) if site_profile is not None else None
+        category_spec = (self.category_classifier.keywords, self.category_from_description)
+        pool = self._get_parse_pool()
+        try:
+            result = pool.submit(_parse_html_worker, body, domain, table_mode, self.strategy_profiles.get(domain),
+                                 site_spec, content_type, category_spec).result()
+        except BrokenProcessPool:
+            self._discard_parse_pool(pool)
+            raise
+        
+        strategy, timings = result['strategy'], result['timings']
+        if strategy is not None and strategy != 'site_profile':
+            self.strategy_profiles.record_success(domain, strategy, result['table_index'], timings.get(strategy))
+        if result['columns'] is None:
+            return None, strategy, timings, result['raw_rows']
+        df = pd.DataFrame(dict(zip(result['columns'], result['arrays'])))
+        print(f"[POOL] Parsed in worker: {len(df)} rows x {len(df.columns)} cols ({strategy})")
+        return df, strategy, timings, result['raw_rows']
+    
+    def _is_oversized(self, url):
+        """Preflight HEAD untuk URL CSV: cek Content-Length sebelum download"""
+        if not self.max_bytes or not url.lower().endswith('.csv'):
+            return False
+        try:
+            response = self.session.head(url, timeout=15, allow_redirects=True)
+            content_length = int(response.headers.get('content-length') or 0)
+        except (requests.exceptions.RequestException, ValueError):
+            return False
+        if content_length > self.max_bytes:
+            print(f"[ABORT] HEAD preflight: {content_length} bytes > limit {self.max_bytes} bytes")
+            return True
+        return False
+    
+    def _iter_csv_chunks(self, response):
+        """Generator: chunk CSV yang sudah di-clean, dibaca langsung dari stream response"""
+        encoding = declared_charset(response.headers.get('content-type')) or 'utf-8'
+        response.raw.decode_content = True
+        stream = io.BufferedReader(_BudgetedStream(response.raw, self.max_bytes), buffer_size=1024 * 1024)
+        
+        total_rows = 0
+        try:
+            reader = pd.read_csv(stream, chunksize=self.csv_chunksize, encoding=encoding,
+                                 encoding_errors='replace')
+            for i, chunk in enumerate(reader):
+                total_rows += len(chunk)
+                print(f"[CSV] Chunk {i + 1}: {len(chunk)} rows (total {total_rows}, {stream.raw.bytes_read} bytes)")
+                chunk = self.clean_scraped_data(chunk)
+                if chunk is not None:
+                    yield chunk
+        finally:
+            response.close()
+    
+    JSON_ENVELOPE_KEYS = ('data', 'results', 'items', 'records', 'features', 'rows', 'hits', 'entries')
+    
+    @staticmethod
+    def _is_ndjson(content_type, url_lower):
+        """Deteksi newline-delimited JSON dari content-type atau ekstensi URL"""
+        return (any(t in content_type for t in ('ndjson', 'jsonl', 'json-seq', 'jsonlines'))
+                or url_lower.endswith(('.ndjson', '.jsonl')))
+    
+    def _find_json_records(self, obj, depth=0):
+        """Cari list of records (dict) di JSON, termasuk di dalam envelope data/results/..."""
+        if isinstance(obj, list):
+            dicts = [item for item in obj if isinstance(item, dict)]
+            if dicts and len(dicts) >= len(obj) / 2:
+                return dicts
+            return None
+        
+        if not isinstance(obj, dict) or depth > 3:
+            return None
+        
+        for key in self.JSON_ENVELOPE_KEYS:
+            for actual_key in obj:
+                if str(actual_key).lower() == key:
+                    records = self._find_json_records(obj[actual_key], depth + 1)
+                    if records:
+                        return records
+        
+        # Tanpa envelope yang dikenal: ambil list of records terbesar di level ini
+        candidates = [self._find_json_records(value, depth + 1) for value in obj.values()
+                      if isinstance(value, (list, dict))]
+        candidates = [c for c in candidates if c]
+        if candidates:
+            return max(candidates, key=len)
+        return None
+    
+    def _parse_json(self, body):
+        """Parse body JSON ke DataFrame (flatten nested field dengan json_normalize)"""
+        records = self._find_json_records(json.loads(body))
+        if not records:
+            print("   [WARN] No record array found in JSON")
+            return None
+        df = pd.json_normalize(records)
+        print(f"[JSON] Loaded: {len(df)} rows x {len(df.columns)} cols")
+        return df
+    
+    def _iter_ndjson_frames(self, response, batch_size=5000):
+        """Generator: DataFrame mentah per batch_size record NDJSON dari stream response"""
+        batch = []
+        bytes_read = 0
+        skipped = 0
+        try:
+            for line in response.iter_lines(chunk_size=64 * 1024):
+                bytes_read += len(line) + 1
+                if self.max_bytes and bytes_read > self.max_bytes:
+                    raise DownloadTooLarge(f"Download melebihi batas {self.max_bytes} bytes")
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                if isinstance(record, dict):
+                    batch.append(record)
+                if len(batch) >= batch_size:
+                    yield pd.json_normalize(batch)
+                    batch = []
+        finally:
+            response.close()
+        
+        if batch:
+            yield pd.json_normalize(batch)
+        if skipped:
+            print(f"   [WARN] Skipped {skipped} invalid NDJSON lines")
+        print(f"[NDJSON] Streamed {bytes_read} bytes")
+    
+    def _read_html_table_stream(self, response, batch_size=5000):
+        """
+        Parse tabel dari HTML besar secara incremental (event-based, tanpa BeautifulSoup tree)
+        Baris dikumpulkan per batch ke DataFrame, return tabel dengan baris terbanyak atau None
+        """
+        encoding = declared_charset(response.headers.get('content-type')) or 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+        
+        builder = StreamingTableBuilder()
+        stream = _BudgetedStream(response.raw, self.max_bytes)
+        response.raw.decode_content = True
+        chunks = iter(lambda: stream.read(256 * 1024), b'')
+        try:
+            for table_index, batch in iter_table_batches(chunks, encoding=encoding, batch_size=batch_size):
+                builder.add(table_index, batch)
+        finally:
+            response.close()
+        
+        table_index, df = builder.build()
+        print(f"[STREAM] Parsed {builder.total_rows} rows in streaming mode ({stream.bytes_read} bytes)")
+        if df is None:
+            return None
+        df = self._coerce_numeric_columns(df)
+        df.attrs['table_index'] = table_index
+        return df
+    
+    def _extract_from_html(self, html, domain=None, table_mode='best', encoding=None):
+        """
+        Jalankan strategy HTML berurutan di atas SATU parsed document
+        html: str, atau bytes + encoding (tanpa salinan str tambahan)
+        Returns: (DataFrame atau None, nama strategy, dict timing per tahap dalam detik)
+        """
+        timings = {}
+        df = self._extract_with_site_profile(domain, timings, html=html, encoding=encoding)
+        if df is not None:
+            return df, 'site_profile', timings
+        soup = self._parse_document(html, timings, encoding=encoding)
+        df, strategy = self._extract_from_soup(soup, timings, domain=domain, table_mode=table_mode)
+        return df, strategy, timings
+    
+    def _extract_with_site_profile(self, domain, timings, soup=None, html=None, encoding=None):
+        """
+        Ekstrak dengan profil selector situs jika ada untuk domain
+        Profil XPath dijalankan di HTML mentah (lxml), profil CSS di soup yang sudah di-parse
+        """
+        profile = self.extraction_profiles.get(domain)
+        if profile is None or (html is None and profile.uses_xpath) or (soup is None and not profile.uses_xpath):
+            return None
+        started = time.perf_counter()
+        try:
+            df = profile.extract_html(html, encoding) if profile.uses_xpath else profile.extract_soup(soup)
+        except Exception as e:
+            print(f"   [WARN] Site profile for {domain} failed: {e}")
+            df = None
+        timings['site_profile'] = round(time.perf_counter() - started, 4)
+        if df is not None and len(df) > 0:
+            print(f"[PROFILE] Site profile for {domain}: {len(df)} rows x {len(df.columns)} cols")
+            return df
+        print(f"[PROFILE] Site profile for {domain} found nothing, falling back to strategy chain")
+        return None
+    
+    @staticmethod
+    def _parse_document(html, timings=None, encoding=None):
+        """
+        Parse HTML sekali dengan parser tercepat yang tersedia (lxml), fallback html.parser
+        html bytes + encoding diberikan langsung ke parser (tanpa decode ke str lebih dulu)
+        """
+        started = time.perf_counter()
+        options = {'from_encoding': encoding} if isinstance(html, bytes) and encoding else {}
+        try:
+            soup = BeautifulSoup(html, HTML_PARSER, **options)
+        except Exception as e:
+            print(f"   [WARN] {HTML_PARSER} parser failed ({e}), falling back to html.parser")
+            soup = BeautifulSoup(html, 'html.parser', **options)
+        elapsed = round(time.perf_counter() - started, 4)
+        if timings is not None:
+            timings['parse'] = elapsed
+        print(f"[PARSE] Document parsed with {HTML_PARSER} in {elapsed:.3f}s")
+        return soup
+    
+    def _extract_from_soup(self, soup, timings, domain=None, table_mode='best'):
+        """
+        Jalankan strategy HTML berurutan di atas parsed document. Return (DataFrame, nama strategy)
+        Jika domain punya profil strategy, strategy tersebut dicoba lebih dulu
+        """
+        df = self._extract_with_site_profile(domain, timings, soup=soup)
+        if df is not None:
+            return df, 'site_profile'
+        
+        strategies = self._html_strategies(table_mode)
+        profile = self.strategy_profiles.get(domain) if domain else None
+        if profile is not None and profile['strategy'] not in {name for name, _, _ in strategies}:
+            profile = None
+        if profile is not None:
+            name = profile['strategy']
+            print(f"[PROFILE] Trying remembered strategy for {domain}: {name} (table {profile.get('table_index')})")
+            started = time.perf_counter()
+            try:
+                df = self._run_profiled_strategy(soup, profile, strategies)
+            except Exception as e:
+                print(f"   [WARN] Remembered strategy failed: {e}")
+                df = None
+            timings[f"profile:{name}"] = round(time.perf_counter() - started, 4)
+            if df is not None and len(df) > 0:
+                print(f"[HTML] Profile hit: {len(df)} rows x {len(df.columns)} cols")
+                self.strategy_profiles.record_success(domain, name, df.attrs.get('table_index'),
+                                                      timings[f"profile:{name}"])
+                return df, name
+            self.strategy_profiles.record_miss(domain)
+            print("[PROFILE] Remembered strategy found nothing, falling back to full chain")
+        
+        for number, (name, label, method) in enumerate(strategies, start=1):
+            print(f"[STRATEGY] Strategy {number}: {label}...")
+            started = time.perf_counter()
+            try:
+                df = method(soup)
+            except Exception as e:
+                print(f"   [WARN] {label} failed: {e}")
+                df = None
+            timings[name] = round(time.perf_counter() - started, 4)
+            
+            if df is not None and len(df) > 0:
+                print(f"[HTML] {label}: {len(df)} rows x {len(df.columns)} cols ({timings[name]:.3f}s)")
+                if domain:
+                    self.strategy_profiles.record_success(domain, name, df.attrs.get('table_index'),
+                                                          timings[name])
+                return df, name
+        
+        return None, None
+    
+    def _run_profiled_strategy(self, soup, profile, strategies):
+        """Jalankan strategy tersimpan, langsung ke index tabel yang diingat jika ada"""
+        name = profile['strategy']
+        table_index = profile.get('table_index')
+        if name in ('html_tables', 'first_table') and table_index is not None:
+            tables = soup.find_all('table')
+            if table_index >= len(tables):
+                return None
+            # Jumlah tabel nav/layout/infobox sebelum tabel data bisa beda antar halaman satu domain
+            if not self._is_data_table(tables[table_index]):
+                print(f"[PROFILE] Remembered table {table_index} is not a data table on this page")
+                return None
+            df = self._table_to_dataframe(tables[table_index])
+            if df is None or (name == 'html_tables' and (len(df) < 3 or len(df.columns) < 2)):
+                return None
+            df.attrs['table_index'] = table_index
+            return df
+        
+        methods = {strategy: method for strategy, _, method in strategies}
+        method = methods.get(name)
+        return method(soup) if method is not None else None
+    
+    def _html_strategies(self, table_mode='best'):
+        """Urutan strategy HTML: (nama, label, method(soup))"""
+        if table_mode == 'union':
+            first = ('table_union', 'Union of compatible HTML tables', self._extract_table_union)
+        else:
+            first = ('html_tables', 'Best-scored HTML table', self._extract_best_table)
+        return [
+            first,
+            ('first_table', 'First HTML table', self._parse_html_table),
+            ('div_list', 'Div/list extraction', self._extract_from_div_lists),
+        ]
+    
+    LAYOUT_TABLE_HINTS = ('nav', 'menu', 'navbox', 'infobox', 'sidebar', 'footer', 'header', 'layout', 'vertical-navbox')
+    
+    def _extract_best_table(self, soup, top_n=3):
+        """
+        Pilih tabel data terbaik berdasarkan skor DOM yang murah (tanpa convert semua tabel)
+        Hanya top_n kandidat teratas yang di-convert ke DataFrame, yang pertama valid dipakai
+        """
+        candidates = []
+        for index, table in enumerate(soup.find_all('table')):
+            score = self._score_table(table)
+            if score > 0:
+                candidates.append((score, index, table))
+        
+        if not candidates:
+            return None
+        
+        candidates.sort(key=lambda c: (-c[0], c[1]))
+        print(f"[TABLE] {len(candidates)} candidate tables, best score {candidates[0][0]:.1f} (table {candidates[0][1]})")
+        
+        for score, index, table in candidates[:top_n]:
+            df = self._table_to_dataframe(table)
+            if df is not None and len(df) >= 3 and len(df.columns) >= 2:
+                df.attrs['table_index'] = index
+                return df
         return None
     
+    def _extract_table_union(self, soup):
+        """
+        Gabungkan semua tabel yang kolomnya kompatibel setelah normalisasi map_columns
+        Grup tabel dengan total baris terbanyak di-concat sekali, kolom 'sumber_tabel' = index tabel
+        """
+        groups = {}
+        for index, table in enumerate(soup.find_all('table')):
+            # Bukan _score_table: batas minimal baris di sana untuk memilih satu tabel, tabel kecil tetap ikut digabung
+            signals = self._table_signals(table)
+            if signals is None or signals[1] < 2 or signals[4]:
+                continue
+            df = self._table_to_dataframe(table)
+            if df is None or len(df) == 0 or len(df.columns) < 2:
+                continue
+            
+            rename_map = self._column_rename_map(df.columns)
+            names = [rename_map.get(col, str(col).strip().lower()) for col in df.columns]
+            if len(set(names)) != len(names):
+                continue
+            df.columns = names
+            groups.setdefault(frozenset(names), []).append((index, df))
+        
+        if not groups:
+            return None
+        
+        signature, members = max(groups.items(), key=lambda item: sum(len(df) for _, df in item[1]))
+        columns = list(members[0][1].columns)
+        frames = [df.reindex(columns=columns) for _, df in members]
+        source = np.repeat([index for index, _ in members], [len(df) for _, df in members])
+        
+        union = pd.concat(frames, ignore_index=True, sort=False)
+        union['sumber_tabel'] = source
+        print(f"[TABLE] Union of {len(members)} compatible tables: {len(union)} rows "
+              f"(tables {[index for index, _ in members]})")
+        return union
+    
+    def _table_signals(self, table, sample_rows=20):
+        """
+        Sinyal DOM satu tabel: (jumlah baris, jumlah kolom modal, konsistensi jumlah kolom,
+        keyword header (alias map_columns), tabel navigasi/layout), None jika tidak ada baris
+        """
+        trs = [tr for tr in table.find_all('tr') if tr.find_parent('table') is table]
+        if not trs:
+            return None
+        
+        widths = [len(tr.find_all(['td', 'th'], recursive=False)) for tr in trs[:sample_rows]]
+        modal_width = max(set(widths), key=widths.count)
+        consistency = widths.count(modal_width) / len(widths)
+        
+        header_cells = trs[0].find_all(['td', 'th'], recursive=False)
+        header_text = [cell.get_text(' ', strip=True).lower() for cell in header_cells]
+        keyword_hits = sum(1 for text in header_text if text and self._is_known_header(text))
+        
+        attrs = ' '.join([table.get('id') or '', ' '.join(table.get('class') or []), table.get('role') or '']).lower()
+        layout = table.find('table') is not None or any(hint in attrs for hint in self.LAYOUT_TABLE_HINTS) \
+            or 'presentation' in attrs
+        return len(trs), modal_width, consistency, keyword_hits, layout
+    
+    def _score_table(self, table, sample_rows=20):
+        """
+        Skor kandidat tabel dari DOM: jumlah baris, konsistensi jumlah kolom,
+        keyword header (alias map_columns), penalti untuk tabel navigasi/layout
+        Return 0 jika bukan tabel data (< 3 baris atau < 2 kolom)
+        """
+        signals = self._table_signals(table, sample_rows)
+        if signals is None:
+            return 0.0
+        rows, modal_width, consistency, keyword_hits, layout = signals
+        if rows < 4 or modal_width < 2:
+            return 0.0
+        score = (rows - 1) * consistency * (1 + 0.5 * keyword_hits)
+        return score * 0.2 if layout else score
+    
+    def _is_data_table(self, table):
+        """Tabel data untuk profil strategy: >= 2 kolom, header berisi nama kolom dikenal, bukan tabel layout"""
+        signals = self._table_signals(table)
+        if signals is None:
+            return False
+        rows, modal_width, consistency, keyword_hits, layout = signals
+        return modal_width >= 2 and keyword_hits > 0 and not layout
+    
+    def _is_known_header(self, text):
+        """Header cocok dengan nama kolom standar atau salah satu alias"""
+        return self.column_matcher.is_known(text)
+    
+    @staticmethod
+    def _table_to_dataframe(table):
+        """Convert satu element <table> ke DataFrame (header dari thead atau baris pertama)"""
+        # Hanya baris milik tabel ini, bukan baris dari nested table
+        trs = [tr for tr in table.find_all('tr') if tr.find_parent('table') is table]
+        if not trs:
+            return None
+        
+        def row_cells(tr):
+            cells = []
+            for cell in tr.find_all(['td', 'th'], recursive=False):
+                text = cell.get_text(strip=True)
+                try:
+                    span = min(int(cell.get('colspan', 1)), 100)
+                except (TypeError, ValueError):
+                    span = 1
+                cells.extend([text] * max(span, 1))
+            return cells
+        
+        thead = table.find('thead')
+        header_trs = [tr for tr in trs if thead is not None and tr.find_parent('thead') is thead]
+        if header_trs:
+            headers = row_cells(header_trs[-1])
+            header_ids = {id(tr) for tr in header_trs}
+            body_trs = [tr for tr in trs if id(tr) not in header_ids]
+        else:
+            headers = row_cells(trs[0])
+            body_trs = trs[1:]
+        
+        if not headers:
+            return None
+        
+        width = len(headers)
+        rows = []
+        for tr in body_trs:
+            cells = row_cells(tr)
+            if cells:
+                rows.append((cells + [''] * width)[:width])
+        
+        if not rows:
+            return None
+        
+        return TourismDataScraper._coerce_numeric_columns(pd.DataFrame(rows, columns=headers))
+    
+    @staticmethod
+    def _coerce_numeric_columns(df):
+        """Kolom yang seluruh isinya angka dijadikan numeric (seperti pd.read_html)"""
+        for i in range(len(df.columns)):
+            col = df.iloc[:, i]
+            filled = col.ne('')
+            if not filled.any():
+                continue
+            numeric = pd.to_numeric(col.where(filled), errors='coerce')
+            if numeric.notna().sum() == filled.sum():
+                df.isetitem(i, numeric)
+        return df
+    
     def _parse_html_table(self, soup):
         """Parse HTML table element"""
         try:
             table = soup.find('table')
             if table is None:
                 return None
-            
-            headers = []
-            rows = []
-            
-            thead = table.find('thead')
-            if thead:
-                for th in thead.find_all('th'):
-                    headers.append(th.get_text(strip=True))
-            else:
-                first_row = table.find('tr')
-                if first_row:
-                    for th in first_row.find_all(['th', 'td']):
-                        headers.append(th.get_text(strip=True))
-            
-            tbody = table.find('tbody') or table
-            for tr in tbody.find_all('tr')[1 if not thead else 0:]:
-                row = []
-                for td in tr.find_all(['td', 'th']):
-                    row.append(td.get_text(strip=True))
-                if row:
-                    rows.append(row)
-            
-            if rows and headers:
-                df = pd.DataFrame(rows, columns=headers)
-                return df
-            
-            return None
+            df = self._table_to_dataframe(table)
+            if df is not None:
+                df.attrs['table_index'] = 0
+            return df
         except Exception as e:
             print(f"[ERROR] Error parsing table: {e}")
             return None
     
+    CARD_SELECTORS = ('div.item', 'div.card', 'div.product', 'article', 'li.item', 'li.result')
+    CARD_FIELD_TAGS = ('p', 'span', 'a', 'h2', 'h3')
+    
     def _extract_from_div_lists(self, soup):
-        """Extract data dari struktur div/list"""
+        """
+        Extract data dari struktur div/list
+        Satu pass dengan selector gabungan, lalu pakai selector prioritas tertinggi yang punya data
+        Tag yang sama dalam satu card diberi nomor (span, span_1, ...) supaya tidak saling menimpa
+        """
         try:
-            data = []
-            selectors = ['div.item', 'div.card', 'div.product', 'article', 'li.item', 'li.result']
+            buckets = {selector: [] for selector in self.CARD_SELECTORS}
+            compiled = [(selector, compile_css(selector)) for selector in self.CARD_SELECTORS]
+            for item in compile_css(', '.join(self.CARD_SELECTORS)).select(soup):
+                for selector, matcher in compiled:
+                    if matcher.match(item):
+                        buckets[selector].append(item)
             
-            for selector in selectors:
-                items = soup.select(selector)
-                if items:
-                    for item in items:
-                        row = {}
-                        for elem in item.find_all(['p', 'span', 'a', 'h2', 'h3']):
-                            text = elem.get_text(strip=True)
-                            if text:
-                                row[elem.name] = text
-                        
-                        if row:
-                            data.append(row)
+            for selector in self.CARD_SELECTORS:
+                data = []
+                for item in buckets[selector]:
+                    row = {}
+                    counts = {}
+                    for elem in item.find_all(self.CARD_FIELD_TAGS):
+                        text = elem.get_text(strip=True)
+                        if text:
+                            seen = counts.get(elem.name, 0)
+                            counts[elem.name] = seen + 1
+                            row[elem.name if seen == 0 else f"{elem.name}_{seen}"] = text
                     
-                    if data:
-                        df = pd.DataFrame(data)
-                        return df
+                    if row:
+                        data.append(row)
+                
+                if data:
+                    return pd.DataFrame(data)
             
             return None
         except Exception as e:
@@ -206,39 +1670,8 @@ class TourismDataScraper:
         
         print(f"[CLEAN] Starting data cleaning... (input: {len(df)} rows x {len(df.columns)} cols)")
         
-        # Remove completely empty columns
-        df = df.dropna(axis=1, how='all')
-        df = df.loc[:, df.astype(str).ne('').any()]
-        
-        # Remove completely empty rows
-        df = df.dropna(axis=0, how='all')
-        df = df[df.astype(str).ne('').any(axis=1)]
-        
-        # Clean column names
-        df.columns = df.columns.str.strip()
-        df.columns = df.columns.str.replace(r'[\n\r\t]', ' ', regex=True)
-        
-        # Handle duplicate column names
-        if df.columns.duplicated().any():
-            cols = pd.Series(df.columns)
-            for dup in cols[cols.duplicated()].unique():
-                dups = cols[cols == dup].index.tolist()
-                for i, idx in enumerate(dups):
-                    df.columns.values[idx] = f"{dup}_{i}"
-                print(f"[WARN] Duplicate column renamed: {dup}")
-        
-        # Clean string columns
-        for col in df.columns:
-            try:
-                if df[col].dtype == 'object':
-                    df[col] = df[col].astype(str).str.strip()
-                    # Replace 'nan' string dengan NaN asli
-                    df[col] = df[col].replace(['nan', 'None', '', 'N/A', 'n/a'], np.nan)
-            except Exception as e:
-                print(f"[WARN] Error cleaning column {col}: {e}")
-        
-        # Reset index
-        df = df.reset_index(drop=True)
+        # Satu pass kolom: kolom/baris kosong, nama kolom, trim + sentinel kosong -> NaN
+        df = self._normalize_frame(df)
         
         # Apply column mapping
         print("[MAP] Applying column mapping...")
@@ -251,25 +1684,8 @@ class TourismDataScraper:
         print("[COORDS] Extracting coordinates...")
         df = self.extract_coordinates(df)
         
-        # Validate rating column jika ada
-        if 'rating' in df.columns:
-            try:
-                df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
-                # Set rating > 5 atau < 0 menjadi NaN (invalid)
-                df.loc[(df['rating'] > 5) | (df['rating'] < 0), 'rating'] = np.nan
-                print(f"[CLEAN] Rating column validated: {df['rating'].notna().sum()} valid values")
-            except Exception as e:
-                print(f"[WARN] Error validating rating: {e}")
-        
-        # Validate harga column jika ada
-        if 'harga' in df.columns:
-            try:
-                df['harga'] = pd.to_numeric(df['harga'], errors='coerce')
-                # Set harga < 0 menjadi NaN (invalid)
-                df.loc[df['harga'] < 0, 'harga'] = np.nan
-                print(f"[CLEAN] Price column validated: {df['harga'].notna().sum()} valid values")
-            except Exception as e:
-                print(f"[WARN] Error validating price: {e}")
+        # Validate rating (0-5) dan harga (>= 0), satu konversi numerik per kolom
+        df = self._validate_numeric_columns(df)
         
         # Remove duplicate rows berdasarkan 'nama' dan 'provinsi' jika ada
         if 'nama' in df.columns and 'provinsi' in df.columns:
@@ -284,55 +1700,120 @@ class TourismDataScraper:
             print("[WARN] Data kosong setelah cleaning!")
             return None
         
+        # Dtype hemat memori (category / string Arrow / float32) untuk frame yang disimpan di session
+        return self.optimize_dtypes(df)
+    
+    def optimize_dtypes(self, df):
+        """
+        Kompakkan dtype DataFrame (lihat frame_dtypes.compact_dtypes), laporkan memory sebelum -> sesudah
+        Hasil memory_usage(deep=True) disimpan di df.attrs['memory_bytes']
+        """
+        if df is None or len(df) == 0:
+            return df
+        try:
+            df, before, after = compact_dtypes(df)
+            df.attrs['memory_bytes'] = {'before': before, 'after': after}
+            print(f"[DTYPE] Memory usage: {before / 1024 / 1024:.2f} MB -> {after / 1024 / 1024:.2f} MB")
+        except Exception as e:
+            print(f"[WARN] Error optimizing dtypes: {e}")
         return df
     
-    def map_columns(self, df):
-        """Map kolom generic ke kolom standar untuk pariwisata - EXTENDED VERSION"""
-        column_mapping = {
-            'nama': [
-                'name', 'destinasi', 'tempat', 'lokasi', 'wisata', 'objek', 'attraction',
-                'title', 'site name', 'place', 'destination', 'nama tempat', 'object',
-                'attraction name', 'site', 'location name', 'nama lokasi'
-            ],
-            'provinsi': [
-                'province', 'provinsi', 'state', 'region', 'daerah', 'country',
-                'negara', 'country/region', 'area', 'province/state', 'administrative region',
-                'location', 'wilayah', 'negara/region', 'state/region'
-            ],
-            'kota': [
-                'city', 'kota', 'kabupaten', 'kab/kota', 'kota/kab', 'town',
-                'municipality', 'district', 'kecamatan', 'locality', 'city/town',
-                'kota/kabupaten'
-            ],
-            'kategori': [
-                'category', 'kategori', 'tipe', 'type', 'jenis', 'kind', 'classification',
-                'site category', 'attraction type', 'category type', 'classification type',
-                'kategori wisata', 'jenis wisata'
-            ],
-            'rating': [
-                'rating', 'nilai', 'score', 'review', 'rank', 'rate', 'stars',
-                'elevation', 'height', 'grade', 'nilai rating'
-            ],
-            'harga': [
-                'price', 'harga', 'biaya', 'cost', 'tarif', 'admission', 'fee',
-                'entry fee', 'entrance fee', 'ticket price', 'biaya masuk'
-            ],
-            'deskripsi': [
-                'description', 'deskripsi', 'keterangan', 'detail', 'remarks',
-                'notes', 'info', 'information', 'catatan', 'penjelasan', 'info detail'
-            ],
-        }
+    BLANK_STRINGS = ('nan', 'None', '', 'N/A', 'n/a')
+    NUMERIC_RANGES = {'rating': (0, 5), 'harga': (0, None)}
+    # Parser teks untuk nilai yang gagal dikonversi langsung ('Rp 25.000', 'Gratis', '4,7/5', '4.5 ★')
+    NUMERIC_PARSERS = {'rating': parse_rating, 'harga': parse_price}
+    # Teks ber-pemisah '.'/',' di kolom ini memakai format Indonesia ('15.000' = 15000), bukan desimal to_numeric
+    SEPARATOR_TEXT_COLUMNS = {'harga'}
+    
+    def _normalize_frame(self, df):
+        """
+        Normalisasi kolumnar satu pass, tanpa astype(str) seluruh frame:
+        - kolom/baris yang seluruhnya NaN atau seluruhnya string kosong dibuang (dari mask per kolom)
+        - nama kolom di-trim, duplikat diberi suffix _0, _1, ...
+        - kolom teks di-trim, string sentinel (BLANK_STRINGS) menjadi NaN
+        """
+        text_columns = [is_object_dtype(dtype) or is_string_dtype(dtype) for dtype in df.dtypes]
+        keep_columns = []
+        row_all_na = np.ones(len(df), dtype=bool)
+        row_all_empty = np.ones(len(df), dtype=bool)
+        for position, is_text in enumerate(text_columns):
+            col = df.iloc[:, position]
+            na = col.isna().to_numpy()
+            empty = col.eq('').to_numpy(dtype=bool, na_value=False) if is_text else np.zeros(len(df), dtype=bool)
+            if na.all() or empty.all():
+                continue
+            keep_columns.append(position)
+            row_all_na &= na
+            row_all_empty &= empty
         
-        mapped_cols = {}
+        keep_rows = ~(row_all_na | row_all_empty) if keep_columns else np.zeros(len(df), dtype=bool)
+        df = df.iloc[np.flatnonzero(keep_rows), keep_columns].reset_index(drop=True)
+        text_columns = [text_columns[position] for position in keep_columns]
         
-        for standard_col, possible_names in column_mapping.items():
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                # Check exact match or partial match
-                if col_lower in possible_names or any(pn in col_lower for pn in possible_names if len(pn) > 2):
-                    if standard_col not in df.columns:
-                        mapped_cols[col] = standard_col
-                        break
+        # Clean column names
+        columns = df.columns.str.strip().str.replace(r'[\n\r\t]', ' ', regex=True)
+        if columns.duplicated().any():
+            names = list(columns)
+            for dup in columns[columns.duplicated()].unique():
+                for i, idx in enumerate(np.flatnonzero(columns == dup)):
+                    names[idx] = f"{dup}_{i}"
+                print(f"[WARN] Duplicate column renamed: {dup}")
+            columns = pd.Index(names)
+        df.columns = columns
+        
+        # Clean string columns
+        for position, is_text in enumerate(text_columns):
+            if not is_text:
+                continue
+            try:
+                text = df.iloc[:, position].astype(str).str.strip()
+                df.isetitem(position, text.mask(text.isin(self.BLANK_STRINGS)))
+            except Exception as e:
+                print(f"[WARN] Error cleaning column {df.columns[position]}: {e}")
+        
+        return df
+    
+    def _validate_numeric_columns(self, df):
+        """
+        Konversi rating/harga ke numerik sekali (lewati jika sudah numerik), nilai di luar range -> NaN
+        Nilai teks yang gagal dikonversi langsung di-parse ulang per kolom dengan NUMERIC_PARSERS,
+        untuk SEPARATOR_TEXT_COLUMNS semua teks yang mengandung '.'/',' juga
+        """
+        for column, (low, high) in self.NUMERIC_RANGES.items():
+            if column not in df.columns:
+                continue
+            try:
+                values = df[column]
+                if not is_numeric_dtype(values):
+                    raw = values
+                    values = pd.to_numeric(raw, errors='coerce')
+                    failed = values.isna() & raw.notna()
+                    if column in self.SEPARATOR_TEXT_COLUMNS:
+                        # '1,5 jt' sudah gagal to_numeric, '15.000' lolos sebagai 15.0 padahal pemisah ribuan
+                        text = raw.astype(object)
+                        if infer_dtype(text, skipna=True) != 'string':
+                            text = text.where(text.map(type).eq(str))
+                        failed |= text.str.contains('.', regex=False, na=False).to_numpy(dtype=bool)
+                    if failed.any():
+                        parsed = self.NUMERIC_PARSERS[column](raw[failed])
+                        values = values.astype(float)
+                        values[failed] = parsed
+                        print(f"[CLEAN] Recovered {parsed.notna().sum()}/{failed.sum()} {column} values from text")
+                invalid = values < low
+                if high is not None:
+                    invalid |= values > high
+                if invalid.any():
+                    values = values.mask(invalid)
+                df[column] = values
+                label = 'Rating' if column == 'rating' else 'Price'
+                print(f"[CLEAN] {label} column validated: {values.notna().sum()} valid values")
+            except Exception as e:
+                print(f"[WARN] Error validating {column}: {e}")
+        return df
+    
+    def map_columns(self, df):
+        """Map kolom generic ke kolom standar untuk pariwisata - EXTENDED VERSION"""
+        mapped_cols = self._column_rename_map(df.columns)
         
         # Apply mappings
         if mapped_cols:
@@ -341,37 +1822,20 @@ class TourismDataScraper:
         
         return df
     
+    def _column_rename_map(self, columns):
+        """Hitung mapping {kolom asli: kolom standar} tanpa mengubah DataFrame (cache per skema kolom)"""
+        return self.column_matcher.rename_map(columns)
+    
     def create_synthetic_columns(self, df):
         """Create synthetic columns jika kolom penting tidak ada"""
         print("[SYNTHETIC] Creating synthetic columns if missing...")
         
-        # Jika tidak ada kategori, coba extract dari nama atau buat default
+        # Jika tidak ada kategori, klasifikasi dari keyword di nama (opsional fallback ke deskripsi)
         if 'kategori' not in df.columns:
-            kategori_keywords = {
-                'beach': ['beach', 'pantai', 'laut', 'sea', 'coast', 'shore'],
-                'mountain': ['mountain', 'gunung', 'peak', 'alpine', 'hiking'],
-                'temple': ['temple', 'candi', 'shrine', 'pagoda', 'religious'],
-                'museum': ['museum', 'gallery', 'art', 'historical'],
-                'city': ['city', 'kota', 'town', 'urban', 'metropolitan'],
-                'nature': ['park', 'forest', 'nature', 'hutan', 'taman', 'alam'],
-                'water': ['lake', 'danau', 'waterfall', 'air terjun', 'geyser'],
-            }
-            
-            categories = []
-            nama_col = 'nama' if 'nama' in df.columns else None
-            
-            for idx, row in df.iterrows():
-                cat = 'Attraction'
-                if nama_col:
-                    text = str(row[nama_col]).lower()
-                    for category, keywords in kategori_keywords.items():
-                        if any(kw in text for kw in keywords):
-                            cat = category.title()
-                            break
-                categories.append(cat)
-            
-            df['kategori'] = categories
-            print(f"[SYNTHETIC] Created 'kategori' column with {len(set(categories))} categories")
+            names = df['nama'] if 'nama' in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+            descriptions = df['deskripsi'] if self.category_from_description and 'deskripsi' in df.columns else None
+            df['kategori'] = self.category_classifier.classify(names, descriptions)
+            print(f"[SYNTHETIC] Created 'kategori' column with {df['kategori'].nunique()} categories")
         
         # Jika tidak ada rating, buat default
         if 'rating' not in df.columns:
@@ -380,146 +1844,75 @@ class TourismDataScraper:
         
         # Jika tidak ada kota, buat default dari provinsi
         if 'kota' not in df.columns and 'provinsi' in df.columns:
-            df['kota'] = df['provinsi'].apply(lambda x: str(x).split(',')[0].strip() if pd.notna(x) else 'Unknown')
+            # Bagian sebelum koma dihitung per provinsi unik; kode -1 (NaN) mengambil elemen terakhir 'Unknown'
+            codes, uniques = pd.factorize(df['provinsi'])
+            kota = pd.Series(uniques).astype(str).str.replace(r'(?s),.*', '', regex=True).str.strip()
+            kota = pd.concat([kota, pd.Series(['Unknown'], dtype=kota.dtype)], ignore_index=True)
+            df['kota'] = kota.iloc[codes].set_axis(df.index)
             print("[SYNTHETIC] Created 'kota' column from 'provinsi'")
         
         return df
     
     def extract_coordinates(self, df):
-        """Extract atau generate koordinat otomatis - IMPROVED VERSION"""
+        """
+        Extract atau generate koordinat otomatis - IMPROVED VERSION
+        Tervektorisasi: mask koordinat valid dihitung sekali, teks lokasi dicocokkan per nilai unik
+        (LocationMatcher), lalu latitude/longitude diisi sekaligus
+        """
         if df is None or len(df) == 0:
             return None
         
         print("[COORDS] Extracting/generating coordinates...")
         
-        # Complete and CORRECTED coordinates untuk 34 provinsi Indonesia
-        # Dikoreksi untuk akurasi geografis maksimal (lat/lon dari geographic center setiap provinsi)
-        province_coords = {
-            'Aceh': (5.2, 96.0),  # FIXED: Aceh di FAR NORTH (bukan -5)
-            'Sumatera Utara': (2.5, 99.0),  # Dikoreksi
-            'Sumatera Barat': (-0.5, 100.5),  # Dikoreksi
-            'Riau': (0.25, 101.5),  # Dikoreksi
-            'Jambi': (-1.5, 102.7),  # Tetap baik
-            'Sumatera Selatan': (-3.2, 104.7),  # Tetap baik
-            'Bengkulu': (-3.8, 102.1),  # Dikoreksi
-            'Lampung': (-4.5, 105.3),  # Tetap baik
-            'Kepulauan Bangka Belitung': (-2.7, 107.6),  # Dikoreksi
-            'Kepulauan Riau': (0.8, 101.7),  # Dikoreksi
-            'DKI Jakarta': (-6.2, 106.8),  # Tetap baik
-            'Jawa Barat': (-6.9, 107.5),  # Tetap baik
-            'Jawa Tengah': (-7.5, 110.4),  # Tetap baik
-            'DI Yogyakarta': (-7.8, 110.4),  # Tetap baik
-            'Daerah Istimewa Yogyakarta': (-7.8, 110.4),  # Tetap baik
-            'Jawa Timur': (-7.3, 112.8),  # Tetap baik
-            'Banten': (-6.3, 106.2),  # Dikoreksi
-            'Bali': (-8.7, 115.2),  # Tetap baik
-            'Nusa Tenggara Barat': (-8.5, 117.3),  # Tetap baik
-            'Nusa Tenggara Timur': (-8.7, 121.0),  # Tetap baik
-            'Kalimantan Barat': (0.0, 111.5),  # FIXED: Center point di equator
-            'Kalimantan Tengah': (-1.7, 113.3),  # Tetap baik
-            'Kalimantan Selatan': (-3.5, 114.7),  # Tetap baik
-            'Kalimantan Timur': (0.5, 116.5),  # Tetap baik
-            'Kalimantan Utara': (4.0, 117.6),  # Tetap baik
-            'Sulawesi Utara': (1.5, 124.7),  # Tetap baik
-            'Sulawesi Tengah': (-1.5, 120.8),  # Dikoreksi
-            'Sulawesi Selatan': (-5.5, 120.0),  # FIXED: Dikoreksi dari -5.1477
-            'Sulawesi Tenggara': (-4.3, 122.5),  # Tetap baik
-            'Gorontalo': (0.7, 122.5),  # Tetap baik
-            'Sulawesi Barat': (-2.1, 119.3),  # Tetap baik
-            'Maluku': (-3.2, 129.2),  # Tetap baik
-            'Maluku Utara': (2.0, 128.0),  # FIXED: Adjusted untuk clarity (utara dari Maluku)
-            'Papua': (-4.5, 138.2),  # Tetap baik
-            'Papua Barat': (-1.9, 131.3),  # Tetap baik
-        }
-        
-        # Extended tourism coordinates - lebih comprehensive
-        tourism_coords = {
-            'Bali': (-8.6705, 115.2126),
-            'Yogyakarta': (-7.7956, 110.3688),
-            'Bandung': (-6.9147, 107.6098),
-            'Jakarta': (-6.2088, 106.8456),
-            'Surabaya': (-7.2575, 112.7521),
-            'Malang': (-7.9827, 112.6345),
-            'Medan': (3.5952, 98.6722),
-            'Pekanbaru': (0.5271, 101.4489),
-            'Makassar': (-5.1477, 119.4327),
-            'Semarang': (-6.9702, 110.4203),
-            'Palembang': (-2.9081, 104.7549),
-            'Banjarmasin': (-3.3243, 114.5971),
-            'Pontianak': (-0.0263, 109.3425),
-            'Samarinda': (-0.4917, 117.1431),
-            'Manado': (1.4748, 124.8244),
-            'Kendari': (-3.9701, 122.5137),
-            'Ambon': (-3.6959, 128.1814),
-            'Jayapura': (-2.5243, 140.6869),
-            'Kupang': (-10.1698, 123.6231),
-        }
-        
         if 'latitude' not in df.columns or 'longitude' not in df.columns:
             df['latitude'] = np.nan
             df['longitude'] = np.nan
         
         # Try to get location columns
-        location_cols = [col for col in df.columns 
-                        if col.lower() in ['provinsi', 'kota', 'lokasi', 'nama', 'destinasi', 'province', 'city', 'location']]
+        location_cols = [position for position, col in enumerate(df.columns)
+                         if isinstance(col, str)
+                         and col.lower() in ['provinsi', 'kota', 'lokasi', 'nama', 'destinasi', 'province', 'city', 'location']]
         
         if not location_cols:
             print("[WARN] No location columns found")
             return df
         
-        coords_added = 0
+        # Baris dengan koordinat valid dilewati
+        lat = self._coordinate_values(df['latitude'])
+        lon = self._coordinate_values(df['longitude'])
+        valid = (lat.between(-90, 90) & lon.between(-180, 180)).to_numpy()
+        
+        # Kolom lokasi dicoba berurutan, hanya untuk baris yang belum valid / belum cocok
+        matched = np.full(len(df), -1, dtype=np.int64)
+        for position in location_cols:
+            pending = np.flatnonzero(~valid & (matched == -1))
+            if len(pending) == 0:
+                break
+            matched[pending] = self.location_matcher.match(df.iloc[pending, position])
         
-        for idx in df.index:
-            # Skip jika sudah ada valid coordinates
+        rows = np.flatnonzero(matched >= 0)
+        if len(rows) > 0:
+            coords = self.location_matcher.coords[matched[rows]]
             try:
-                lat = pd.to_numeric(df.at[idx, 'latitude'], errors='coerce')
-                lon = pd.to_numeric(df.at[idx, 'longitude'], errors='coerce')
-                
-                if pd.notna(lat) and pd.notna(lon) and -90 <= lat <= 90 and -180 <= lon <= 180:
-                    continue
-            except:
-                pass
-            
-            # Try to match dengan tourism coordinates
-            found = False
-            for loc_col in location_cols:
-                if found:
-                    break
-                    
-                try:
-                    location_text = str(df.at[idx, loc_col]).strip()
-                    if not location_text or location_text.lower() == 'nan':
-                        continue
-                    
-                    location_lower = location_text.lower()
-                    
-                    # First try tourism coordinates (more specific)
-                    for place, coords in tourism_coords.items():
-                        if place.lower() in location_lower:
-                            df.at[idx, 'latitude'] = coords[0]
-                            df.at[idx, 'longitude'] = coords[1]
-                            found = True
-                            coords_added += 1
-                            break
-                    
-                    # Then try province coordinates (more general)
-                    # Sort by length descending to match longer names first (e.g., 'Maluku Utara' before 'Maluku')
-                    if not found:
-                        sorted_provinces = sorted(province_coords.items(), key=lambda x: len(x[0]), reverse=True)
-                        for prov, coords in sorted_provinces:
-                            if prov.lower() in location_lower:
-                                df.at[idx, 'latitude'] = coords[0]
-                                df.at[idx, 'longitude'] = coords[1]
-                                found = True
-                                coords_added += 1
-                                break
-                except Exception as e:
-                    print(f"[WARN] Error processing row {idx}: {e}")
-                    continue
+                for coord_col, values in (('latitude', coords[:, 0]), ('longitude', coords[:, 1])):
+                    # int / float32 (hasil optimize_dtypes) / string / category tidak bisa menampung koordinat float64
+                    dtype = df[coord_col].dtype
+                    if dtype != np.float64 and not is_object_dtype(dtype):
+                        numeric = is_integer_dtype(dtype) or is_float_dtype(dtype)
+                        df[coord_col] = df[coord_col].astype(np.float64 if numeric else object)
+                    df.iloc[rows, df.columns.get_loc(coord_col)] = values
+            except Exception as e:
+                print(f"[WARN] Error assigning coordinates: {e}")
+                rows = rows[:0]
         
-        print(f"[OK] Coordinates added: {coords_added} rows")
+        print(f"[OK] Coordinates added: {len(rows)} rows")
         return df
     
+    @staticmethod
+    def _coordinate_values(values):
+        """Kolom koordinat sebagai float (nilai yang bukan angka -> NaN)"""
+        return pd.to_numeric(values, errors='coerce').astype(float)
+    
     def validate_data(self, df):
         """Validate data untuk GIS mapping"""
         if df is None or len(df) == 0:
@@ -663,3 +2056,47 @@ class TourismDataScraper:
             (df['longitude'] >= -180) &
             (df['longitude'] <= 180)
         )
+
+
+_WORKER_SCRAPER = None
+
+
+def _parse_html_worker(body, domain, table_mode='best', strategy_hint=None, site_spec=None, content_type=None,
+                       category_spec=None):
+    """
+    Dijalankan di process pool: decode + parse + extract + cleaning satu halaman HTML
+    category_spec: (keywords, from_description) dari scraper utama untuk kategori sintetis
+    Return dict kecil (nama kolom + array per kolom: numpy, atau extension array untuk category/string), bukan objek soup / DataFrame
+    """
+    global _WORKER_SCRAPER
+    if _WORKER_SCRAPER is None:
+        _WORKER_SCRAPER = TourismDataScraper(rate_limit=None)
+    scraper = _WORKER_SCRAPER
+    # Profil dari proses utama hanya dipakai sebagai petunjuk untuk halaman ini
+    scraper.strategy_profiles = StrategyProfileStore()
+    scraper.extraction_profiles = ExtractionProfileRegistry()
+    if strategy_hint:
+        scraper.strategy_profiles.record_success(domain, strategy_hint['strategy'], strategy_hint.get('table_index'))
+    if site_spec:
+        scraper.extraction_profiles.register(domain, *site_spec)
+    if category_spec:
+        keywords, scraper.category_from_description = category_spec
+        # Classifier hanya di-compile ulang jika keyword berbeda dari halaman sebelumnya
+        if scraper.category_classifier.keywords != keywords:
+            scraper.category_classifier = CategoryClassifier(keywords)
+    
+    df, strategy, timings = scraper._extract_from_html(body, domain=domain, table_mode=table_mode,
+                                                       encoding=sniff_encoding(body, content_type))
+    result = {'strategy': strategy, 'timings': timings, 'raw_rows': 0, 'table_index': None,
+              'columns': None, 'arrays': None}
+    if df is None or len(df) == 0:
+        return result
+    result['raw_rows'] = len(df)
+    result['table_index'] = df.attrs.get('table_index')
+    
+    df = scraper.clean_scraped_data(df)
+    if df is not None:
+        result['columns'] = list(df.columns)
+        result['arrays'] = [df[column].array if isinstance(df[column].dtype, pd.api.extensions.ExtensionDtype)
+                            else df[column].to_numpy() for column in df.columns]
+    return result
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import time
+
+
+class StrategyProfileStore:
+    """
+    Profil strategy per domain: strategy & index tabel yang terakhir berhasil, plus timing
+    Scrape berikutnya ke domain yang sama langsung mencoba strategy ini lebih dulu
+    """
+
+    SAVE_EVERY = 20
+
+    def __init__(self, path=None):
+        """path: file JSON untuk menyimpan profil (None = hanya di memori)"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._profiles = self._load()
+        self._dirty = 0
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[PROFILE] Failed to load strategy profiles: {e}")
+            return {}
+
+    def get(self, domain):
+        """Return dict profil untuk domain atau None"""
+        with self._lock:
+            profile = self._profiles.get(domain)
+            return dict(profile) if profile else None
+
+    def record_success(self, domain, strategy, table_index=None, elapsed=None):
+        """Catat strategy yang berhasil untuk domain"""
+        with self._lock:
+            profile = self._profiles.get(domain)
+            changed = (profile is None or profile.get('strategy') != strategy
+                       or profile.get('table_index') != table_index)
+            if changed:
+                profile = self._profiles[domain] = {'strategy': strategy, 'table_index': table_index,
+                                                    'hits': 0, 'misses': 0, 'avg_seconds': None}
+            profile['hits'] += 1
+            if elapsed is not None:
+                avg = profile.get('avg_seconds')
+                profile['avg_seconds'] = round(elapsed if avg is None else avg * 0.8 + elapsed * 0.2, 4)
+            profile['updated_at'] = time.time()
+            self._dirty += 1
+            should_save = changed or self._dirty >= self.SAVE_EVERY
+        if should_save:
+            self.save()
+
+    def record_miss(self, domain):
+        """Strategy tersimpan gagal untuk domain ini (fallback ke full chain)"""
+        with self._lock:
+            profile = self._profiles.get(domain)
+            if profile is not None:
+                profile['misses'] = profile.get('misses', 0) + 1
+                self._dirty += 1
+
+    def save(self):
+        """Tulis profil ke disk (atomic replace)"""
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._profiles, indent=2)
+            self._dirty = 0
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[PROFILE] Failed to save strategy profiles: {e}")
+
+    def __len__(self):
+        with self._lock:
+            return len(self._profiles)
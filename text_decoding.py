@@ -0,0 +1,64 @@
+import codecs
+import re
+
+from requests.compat import chardet
+
+HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+META_CHARSET_RE = re.compile(
+    rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I
+)
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _normalize_codec(name):
+    """Nama codec Python yang valid untuk label charset, atau None"""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip().strip('"\'')).name
+    except LookupError:
+        return None
+
+
+def declared_charset(content_type):
+    """Charset dari header Content-Type (hanya jika eksplisit), atau None"""
+    match = HEADER_CHARSET_RE.search(content_type or '')
+    return _normalize_codec(match.group(1)) if match else None
+
+
+def sniff_encoding(body, content_type=None, meta_bytes=4096, sample_bytes=64 * 1024):
+    """
+    Tentukan encoding body (bytes) semurah mungkin, berurutan:
+    BOM -> charset di header -> <meta charset> di awal dokumen -> prefix valid UTF-8 -> deteksi dari prefix
+    Deteksi charset hanya dijalankan pada sample_bytes pertama, bukan seluruh body
+    """
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return encoding
+
+    encoding = declared_charset(content_type)
+    if encoding:
+        return encoding
+
+    match = META_CHARSET_RE.search(body[:meta_bytes])
+    if match:
+        encoding = _normalize_codec(match.group(1).decode('ascii', 'ignore'))
+        if encoding:
+            return encoding
+
+    sample = body[:sample_bytes]
+    try:
+        # final=False: karakter multi-byte yang terpotong di ujung sample tidak dianggap error
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    return _normalize_codec(chardet.detect(sample).get('encoding')) or 'windows-1252'
+